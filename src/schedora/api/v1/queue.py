@@ -35,10 +35,8 @@ def get_queue_stats(queue: RedisQueue = Depends(get_redis_queue)):
     Returns:
         QueueStatsResponse: Queue and DLQ lengths
     """
-    return QueueStatsResponse(
-        pending_jobs=queue.get_queue_length(),
-        dlq_jobs=queue.get_dlq_length(),
-    )
+    pending_jobs, dlq_jobs = queue.get_lengths()
+    return QueueStatsResponse(pending_jobs=pending_jobs, dlq_jobs=dlq_jobs)
 
 
 @router.post("/purge", response_model=QueuePurgeResponse)
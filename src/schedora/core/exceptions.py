@@ -22,7 +22,9 @@ class JobNotFoundError(SchedoraException):
 class DuplicateIdempotencyKeyError(SchedoraException):
     """Raised when attempting to create a job with a duplicate idempotency key."""
 
-    pass
+    def __init__(self, idempotency_key: str):
+        self.idempotency_key = idempotency_key
+        super().__init__(f"Job with idempotency key '{idempotency_key}' already exists")
 
 
 class WorkflowNotFoundError(SchedoraException):
@@ -0,0 +1,34 @@
+"""add_workers_stopped_cleanup_index
+
+Revision ID: 9b3f1c2d7e40
+Revises: 4e00dcb4a03e
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3f1c2d7e40'
+down_revision: Union[str, Sequence[str], None] = '4e00dcb4a03e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_workers_stopped_cleanup',
+        'workers',
+        ['stopped_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'STOPPED'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_workers_stopped_cleanup', table_name='workers')
@@ -1,9 +1,13 @@
 """Base model class with common fields."""
 from datetime import datetime
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from schedora.core.database import Base
 
+# JSONB on PostgreSQL, plain JSON elsewhere (e.g. in-memory SQLite in tests)
+PortableJSON = JSON().with_variant(JSONB(), "postgresql")
+
 
 class TimestampMixin:
     """Mixin for timestamp fields."""
@@ -14,11 +14,11 @@ from sqlalchemy import (
     Column,
     ForeignKey,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from schedora.core.database import Base
 from schedora.core.enums import JobStatus, RetryPolicy
-from schedora.models.base import TimestampMixin
+from schedora.models.base import PortableJSON, TimestampMixin
 
 # Job dependencies table for DAG support (many-to-many self-referential)
 job_dependencies = Table(
@@ -46,7 +46,7 @@ class Job(Base, TimestampMixin):
 
     # Job classification
     type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    payload: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
+    payload: Mapped[Dict[str, Any]] = mapped_column(PortableJSON, nullable=False, default=dict)
 
     # Scheduling & Priority
     priority: Mapped[int] = mapped_column(Integer, nullable=False, default=5, index=True)
@@ -96,10 +96,10 @@ class Job(Base, TimestampMixin):
 
     # Error tracking
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    error_details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    error_details: Mapped[Optional[Dict[str, Any]]] = mapped_column(PortableJSON, nullable=True)
 
     # Result storage
-    result: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    result: Mapped[Optional[Dict[str, Any]]] = mapped_column(PortableJSON, nullable=True)
 
     # Constraints
     __table_args__ = (
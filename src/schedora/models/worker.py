@@ -9,12 +9,12 @@ from sqlalchemy import (
     DateTime,
     Float,
     Enum as SQLEnum,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from schedora.core.database import Base
 from schedora.core.enums import WorkerStatus
-from schedora.models.base import TimestampMixin
+from schedora.models.base import PortableJSON, TimestampMixin
 
 
 class Worker(Base, TimestampMixin):
@@ -84,10 +84,10 @@ class Worker(Base, TimestampMixin):
 
     # Worker capabilities and metadata
     capabilities: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSONB, nullable=True, default=dict
+        PortableJSON, nullable=True, default=dict
     )
     worker_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSONB, nullable=True, default=dict
+        PortableJSON, nullable=True, default=dict
     )
 
     # Constraints
@@ -122,6 +122,12 @@ class Worker(Base, TimestampMixin):
         ),
         Index("idx_workers_status_heartbeat", "status", "last_heartbeat_at"),
         Index("idx_workers_hostname_pid", "hostname", "pid"),
+        # Partial index for delete_old_stopped_workers; only stopped rows
+        Index(
+            "idx_workers_stopped_cleanup",
+            "stopped_at",
+            postgresql_where=text("status = 'STOPPED'"),
+        ),
     )
 
     def __repr__(self) -> str:
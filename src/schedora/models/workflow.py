@@ -2,10 +2,10 @@
 from uuid import uuid4
 from typing import Optional, Dict, Any, List
 from sqlalchemy import String, Text, Table, Column, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from schedora.core.database import Base
-from schedora.models.base import TimestampMixin
+from schedora.models.base import PortableJSON, TimestampMixin
 
 # Association table for workflow-job many-to-many relationship
 workflow_jobs = Table(
@@ -36,7 +36,7 @@ class Workflow(Base, TimestampMixin):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Configuration (timeout, notifications, etc.)
-    config: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    config: Mapped[Optional[Dict[str, Any]]] = mapped_column(PortableJSON, nullable=True)
 
     # Relationships
     jobs: Mapped[List["Job"]] = relationship(  # type: ignore
@@ -116,8 +116,9 @@ def update_queue_metrics(queue: Optional["RedisQueue"] = None) -> None:
     if not queue:
         return
 
-    queue_length.labels(queue_name="jobs").set(queue.get_queue_length())
-    queue_dlq_length.labels(queue_name="jobs").set(queue.get_dlq_length())
+    pending, dead = queue.get_lengths()
+    queue_length.labels(queue_name="jobs").set(pending)
+    queue_dlq_length.labels(queue_name="jobs").set(dead)
 
 
 def record_job_created(job_type: str) -> None:
@@ -1,5 +1,5 @@
 """Job repository for database operations."""
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set
 from uuid import UUID
 from sqlalchemy.orm import Session
 from schedora.models.job import Job
@@ -42,6 +42,28 @@ class JobRepository:
         self.db.refresh(job)
         return job
 
+    def create_many(self, jobs_data: List[Dict[str, Any]]) -> List[Job]:
+        """
+        Create several jobs with a single flush.
+
+        Args:
+            jobs_data: List of job attribute dictionaries
+
+        Returns:
+            List[Job]: Created job instances, in input order
+        """
+        from datetime import datetime, timezone
+
+        now = datetime.now(timezone.utc)
+        jobs = [Job(**job_data) for job_data in jobs_data]
+        for job in jobs:
+            if job.scheduled_at and job.scheduled_at > now:
+                job.status = JobStatus.SCHEDULED
+
+        self.db.add_all(jobs)
+        self.db.flush()
+        return jobs
+
     def get_by_id(self, job_id: UUID) -> Optional[Job]:
         """
         Retrieve job by ID.
@@ -52,7 +74,7 @@ class JobRepository:
         Returns:
             Optional[Job]: Job instance or None if not found
         """
-        return self.db.query(Job).filter(Job.job_id == job_id).first()
+        return self.db.get(Job, job_id)
 
     def get_by_idempotency_key(self, idempotency_key: str) -> Optional[Job]:
         """
@@ -70,6 +92,23 @@ class JobRepository:
             .first()
         )
 
+    def get_existing_idempotency_keys(self, idempotency_keys: List[str]) -> Set[str]:
+        """
+        Return which of the given idempotency keys are already taken.
+
+        Args:
+            idempotency_keys: Keys to check
+
+        Returns:
+            Set[str]: Subset of the keys that already exist
+        """
+        rows = (
+            self.db.query(Job.idempotency_key)
+            .filter(Job.idempotency_key.in_(idempotency_keys))
+            .all()
+        )
+        return {row.idempotency_key for row in rows}
+
     def update_status(self, job_id: UUID, status: JobStatus) -> Job:
         """
         Update job status.
@@ -62,7 +62,7 @@ class WorkerRepository:
         Returns:
             Optional[Worker]: Worker instance or None if not found
         """
-        return self.db.query(Worker).filter(Worker.worker_id == worker_id).first()
+        return self.db.get(Worker, worker_id)
 
     def update(self, worker_id: str, **kwargs: Any) -> Worker:
         """
@@ -57,7 +57,7 @@ class WorkflowRepository:
         Returns:
             Optional[Workflow]: Workflow if found, None otherwise
         """
-        return self.db.query(Workflow).filter(Workflow.workflow_id == workflow_id).first()
+        return self.db.get(Workflow, workflow_id)
 
     def get_by_name(self, name: str) -> Optional[Workflow]:
         """
@@ -89,6 +89,29 @@ class WorkflowRepository:
             workflow.jobs.append(job)
             self.db.flush()
 
+    def add_jobs(self, workflow_id: UUID, job_ids: List[UUID]) -> None:
+        """
+        Add several jobs to a workflow with one job lookup and one flush.
+
+        Job IDs that do not exist are skipped, as with add_job.
+
+        Args:
+            workflow_id: Workflow UUID
+            job_ids: Job UUIDs
+
+        Note:
+            Transaction management is handled by the service layer.
+        """
+        workflow = self.get_by_id(workflow_id)
+        if not workflow or not job_ids:
+            return
+
+        jobs = self.db.query(Job).filter(Job.job_id.in_(job_ids)).all()
+        if jobs:
+            # The association rows flush together as one executemany INSERT
+            workflow.jobs.extend(jobs)
+            self.db.flush()
+
     def get_workflow_jobs(self, workflow_id: UUID) -> List[Job]:
         """
         Get all jobs associated with a workflow.
@@ -1,5 +1,6 @@
 """Dependency resolution service for DAG workflows."""
-from typing import List
+from graphlib import TopologicalSorter
+from typing import Iterable, List
 from sqlalchemy.orm import Session
 from sqlalchemy import select, exists
 from schedora.models.job import Job, job_dependencies
@@ -48,6 +49,24 @@ class DependencyResolver:
         failed_states = {JobStatus.FAILED, JobStatus.DEAD, JobStatus.CANCELED}
         return any(dep.status in failed_states for dep in job.dependencies)
 
+    def validate_acyclic(self, jobs: Iterable[Job]) -> None:
+        """
+        Validate that the dependency graph of the given jobs has no cycles.
+
+        Uses graphlib.TopologicalSorter, which detects cycles iteratively
+        in O(V+E) without Python recursion.
+
+        Args:
+            jobs: Job instances forming the graph to validate
+
+        Raises:
+            graphlib.CycleError: If the dependencies contain a cycle
+        """
+        sorter = TopologicalSorter()
+        for job in jobs:
+            sorter.add(job.job_id, *(dep.job_id for dep in job.dependencies))
+        sorter.prepare()
+
     def get_ready_jobs(self, limit: int = 100) -> List[Job]:
         """
         Get jobs that are ready to execute (dependencies met, status PENDING).
@@ -1,6 +1,6 @@
 """Job service for business logic."""
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from schedora.repositories.job_repository import JobRepository
@@ -46,9 +46,7 @@ class JobService:
         # Check for duplicate idempotency key
         existing_job = self.repository.get_by_idempotency_key(job_data.idempotency_key)
         if existing_job is not None:
-            raise DuplicateIdempotencyKeyError(
-                f"Job with idempotency key '{job_data.idempotency_key}' already exists"
-            )
+            raise DuplicateIdempotencyKeyError(job_data.idempotency_key)
 
         try:
             job = self.repository.create(job_data.model_dump())
@@ -61,12 +59,60 @@ class JobService:
             return job
         except IntegrityError as e:
             # Handle race condition where duplicate was inserted between check and create
-            if "idempotency_key" in str(e):
+            # Check the driver message only; str(e) also renders the statement
+            if "idempotency_key" in str(e.orig):
+                raise DuplicateIdempotencyKeyError(job_data.idempotency_key)
+            raise
+
+    def create_jobs_bulk(self, jobs_data: List[JobCreate]) -> List[Job]:
+        """
+        Create several jobs in one transaction and enqueue them together.
+
+        Args:
+            jobs_data: Job creation schemas
+
+        Returns:
+            List[Job]: Created job instances, in input order
+
+        Raises:
+            DuplicateIdempotencyKeyError: If an idempotency key already exists
+                or appears twice in the batch
+        """
+        keys = [job_data.idempotency_key for job_data in jobs_data]
+        seen = set()
+        for key in keys:
+            if key in seen:
+                raise DuplicateIdempotencyKeyError(key)
+            seen.add(key)
+
+        existing_keys = self.repository.get_existing_idempotency_keys(keys)
+        if existing_keys:
+            raise DuplicateIdempotencyKeyError(next(k for k in keys if k in existing_keys))
+
+        try:
+            jobs = self.repository.create_many([job_data.model_dump() for job_data in jobs_data])
+            # Read before the commit expires them, so enqueueing needs no reloads
+            to_enqueue = [
+                (job.job_id, job.priority)
+                for job in jobs
+                if job.status == JobStatus.PENDING
+            ]
+            self.db.commit()
+        except IntegrityError as e:
+            # Handle race condition where a key was inserted between check and create
+            self.db.rollback()
+            if "idempotency_key" in str(e.orig):
+                existing_keys = self.repository.get_existing_idempotency_keys(keys)
                 raise DuplicateIdempotencyKeyError(
-                    f"Job with idempotency key '{job_data.idempotency_key}' already exists"
+                    next((k for k in keys if k in existing_keys), keys[0])
                 )
             raise
 
+        if self.queue:
+            self.queue.enqueue_many(to_enqueue)
+
+        return jobs
+
     def get_job(self, job_id: UUID) -> Job:
         """
         Get job by ID.
@@ -106,12 +152,13 @@ class JobService:
 
         # Update status
         updated_job = self.repository.update_status(job_id, JobStatus.CANCELED)
+        self.db.commit()
 
-        # Remove from queue if present
+        # Remove from queue only once the cancel is durable; a worker that
+        # still dequeues it sees CANCELED and the claim is rejected
         if self.queue:
             self.queue.remove(job_id)
 
-        self.db.commit()
         return updated_job
 
     def transition_status(self, job_id: UUID, new_status: JobStatus) -> Job:
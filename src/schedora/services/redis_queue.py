@@ -1,19 +1,75 @@
 """Redis-based job queue for scalable job distribution."""
 import json
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 from redis import Redis
 
+# Atomically reserve one sequence number per job and ZADD each job with
+# score = priority * scale - seq, so equal priorities pop oldest first.
+# KEYS: queue zset, sequence counter. ARGV: scale, then priority/job_id pairs.
+_ENQUEUE_SCRIPT = """
+local count = (#ARGV - 1) / 2
+local seq = redis.call('INCRBY', KEYS[2], count) - count
+local scale = tonumber(ARGV[1])
+for i = 2, #ARGV, 2 do
+    seq = seq + 1
+    redis.call('ZADD', KEYS[1], tonumber(ARGV[i]) * scale - seq, ARGV[i + 1])
+end
+return count
+"""
+
+# One-off upgrade step: rescore entries queued before FIFO scoring, whose
+# score is the raw priority, keeping their previous dequeue order. A queue
+# that already has a sequence counter has been written with the new scores
+# and is left alone. KEYS: queue zset, sequence counter. ARGV: scale.
+_RESCORE_LEGACY_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+local entries = redis.call('ZREVRANGE', KEYS[1], 0, -1, 'WITHSCORES')
+local scale = tonumber(ARGV[1])
+local seq = 0
+for i = 1, #entries, 2 do
+    seq = seq + 1
+    redis.call('ZADD', KEYS[1], tonumber(entries[i + 1]) * scale - seq, entries[i])
+end
+if seq > 0 then
+    redis.call('SET', KEYS[2], seq)
+end
+return seq
+"""
+
+# Record each job in the DLQ hash and drop it from the queue atomically.
+# KEYS: queue zset, DLQ hash. ARGV: job_id/metadata pairs.
+_MOVE_TO_DLQ_SCRIPT = """
+for i = 1, #ARGV, 2 do
+    redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+    redis.call('ZREM', KEYS[1], ARGV[i])
+end
+return #ARGV / 2
+"""
+
 
 class RedisQueue:
     """
     Redis-based priority queue for jobs.
 
     Uses Redis sorted sets for priority queue functionality.
-    Higher priority values are dequeued first.
+    Higher priority values are dequeued first; jobs with the same
+    priority are dequeued in the order they were enqueued.
+
+    Scores are not priorities: each job is scored
+    priority * PRIORITY_SCALE - seq, where seq is a per-queue enqueue
+    counter. Queues written by older versions, which scored jobs by raw
+    priority, must be converted once with rescore_legacy_entries() before
+    new jobs are enqueued.
     """
 
+    # Room for 10^12 enqueues before the FIFO tie-breaker could cross
+    # into the next priority level.
+    PRIORITY_SCALE = 10**12
+
     def __init__(self, redis: Redis, queue_name: str = "jobs"):
         """
         Initialize Redis queue.
@@ -25,6 +81,10 @@ class RedisQueue:
         self.redis = redis
         self.queue_name = f"schedora:queue:{queue_name}"
         self.dlq_name = f"{self.queue_name}:dlq"
+        self.seq_name = f"{self.queue_name}:seq"
+        self._enqueue_script = redis.register_script(_ENQUEUE_SCRIPT)
+        self._move_to_dlq_script = redis.register_script(_MOVE_TO_DLQ_SCRIPT)
+        self._rescore_legacy_script = redis.register_script(_RESCORE_LEGACY_SCRIPT)
 
     def enqueue(self, job_id: UUID, priority: int = 0) -> None:
         """
@@ -34,9 +94,37 @@ class RedisQueue:
             job_id: Job UUID
             priority: Job priority (higher = processed first, default: 0)
         """
-        # Use sorted set with priority as score
-        # Higher scores are processed first (ZPOPMAX)
-        self.redis.zadd(self.queue_name, {str(job_id): priority})
+        self.enqueue_many([(job_id, priority)])
+
+    def enqueue_many(self, jobs: Iterable[Tuple[UUID, int]]) -> None:
+        """
+        Add several jobs to the queue in a single script call.
+
+        Args:
+            jobs: (job_id, priority) pairs, in enqueue order
+        """
+        args = [self.PRIORITY_SCALE]
+        for job_id, priority in jobs:
+            args.extend((priority, str(job_id)))
+        if len(args) > 1:
+            # Higher scores are processed first (ZPOPMAX)
+            self._enqueue_script(keys=[self.queue_name, self.seq_name], args=args)
+
+    def rescore_legacy_entries(self) -> int:
+        """
+        Convert entries scored by raw priority to the FIFO scoring scheme.
+
+        Run once after upgrading, with the old API instances stopped and
+        before anything enqueues with the new scores. Jobs keep the order
+        they would have been dequeued in. Does nothing once the queue has
+        a sequence counter, so running it again is safe.
+
+        Returns:
+            int: Number of entries rescored
+        """
+        return self._rescore_legacy_script(
+            keys=[self.queue_name, self.seq_name], args=[self.PRIORITY_SCALE]
+        )
 
     def dequeue(self) -> Optional[UUID]:
         """
@@ -53,6 +141,21 @@ class RedisQueue:
             return UUID(job_id_str)
         return None
 
+    def dequeue_many(self, n: int) -> List[UUID]:
+        """
+        Remove and return up to n jobs in priority order with one ZPOPMAX.
+
+        Args:
+            n: Maximum number of jobs to dequeue
+
+        Returns:
+            List[UUID]: Job IDs, highest priority first (empty if queue empty)
+        """
+        if n <= 0:
+            return []
+        result = self.redis.zpopmax(self.queue_name, count=n)
+        return [UUID(job_id_str) for job_id_str, _priority in result]
+
     def peek(self) -> Optional[UUID]:
         """
         View highest priority job without removing it.
@@ -74,6 +177,21 @@ class RedisQueue:
             return UUID(job_id_str)
         return None
 
+    def peek_many(self, n: int) -> List[UUID]:
+        """
+        View the next n jobs in dequeue order without removing them.
+
+        Args:
+            n: Maximum number of jobs to return
+
+        Returns:
+            List[UUID]: Job IDs, highest priority first
+        """
+        if n <= 0:
+            return []
+        result = self.redis.zrange(self.queue_name, 0, n - 1, desc=True)
+        return [UUID(job_id_str) for job_id_str in result]
+
     def remove(self, job_id: UUID) -> bool:
         """
         Remove a specific job from the queue.
@@ -84,8 +202,22 @@ class RedisQueue:
         Returns:
             bool: True if job was removed, False if not found
         """
-        removed = self.redis.zrem(self.queue_name, str(job_id))
-        return removed > 0
+        return self.remove_many([job_id]) > 0
+
+    def remove_many(self, job_ids: Iterable[UUID]) -> int:
+        """
+        Remove several jobs from the queue in a single ZREM.
+
+        Args:
+            job_ids: Job UUIDs to remove
+
+        Returns:
+            int: Number of jobs that were in the queue and got removed
+        """
+        members = [str(job_id) for job_id in job_ids]
+        if not members:
+            return 0
+        return self.redis.zrem(self.queue_name, *members)
 
     def get_queue_length(self) -> int:
         """
@@ -104,17 +236,31 @@ class RedisQueue:
             job_id: Job UUID
             reason: Failure reason
         """
-        # Store job with failure metadata in hash
-        dlq_data = json.dumps({
-            "job_id": str(job_id),
-            "reason": reason,
-            "moved_at": datetime.now(timezone.utc).isoformat(),
-        })
+        self.move_many_to_dlq([(job_id, reason)])
+
+    def move_many_to_dlq(self, jobs: Iterable[Tuple[UUID, str]]) -> None:
+        """
+        Move several failed jobs to the dead letter queue in one script call.
 
-        self.redis.hset(self.dlq_name, str(job_id), dlq_data)
+        Each job is stored in the DLQ hash with its failure metadata and
+        removed from the main queue if present.
 
-        # Remove from main queue if present
-        self.remove(job_id)
+        Args:
+            jobs: (job_id, reason) pairs
+        """
+        moved_at = datetime.now(timezone.utc).isoformat()
+        args = []
+        for job_id, reason in jobs:
+            dlq_data = json.dumps({
+                "job_id": str(job_id),
+                "reason": reason,
+                "moved_at": moved_at,
+            })
+            args.extend((str(job_id), dlq_data))
+        if args:
+            self._move_to_dlq_script(
+                keys=[self.queue_name, self.dlq_name], args=args
+            )
 
     def get_dlq_length(self) -> int:
         """
@@ -125,10 +271,25 @@ class RedisQueue:
         """
         return self.redis.hlen(self.dlq_name)
 
+    def get_lengths(self) -> Tuple[int, int]:
+        """
+        Get queue and DLQ lengths in a single round trip.
+
+        Returns:
+            Tuple[int, int]: (jobs in queue, jobs in DLQ)
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zcard(self.queue_name)
+        pipe.hlen(self.dlq_name)
+        queue_length, dlq_length = pipe.execute()
+        return queue_length, dlq_length
+
     def purge(self) -> None:
         """Delete all jobs from the queue."""
-        self.redis.delete(self.queue_name)
+        # UNLINK frees a large sorted set in the background instead of
+        # blocking Redis while it is reclaimed
+        self.redis.unlink(self.queue_name)
 
     def purge_dlq(self) -> None:
         """Delete all jobs from the dead letter queue."""
-        self.redis.delete(self.dlq_name)
+        self.redis.unlink(self.dlq_name)
@@ -2,8 +2,8 @@
 import uuid
 from typing import Optional, List
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, select
+from sqlalchemy.orm import Session, lazyload
+from sqlalchemy import and_, select, update
 from schedora.models.job import Job, job_dependencies
 from schedora.core.enums import JobStatus
 
@@ -41,6 +41,38 @@ class Scheduler:
         Returns:
             Job: Claimed job or None if no jobs available
         """
+        claimed = self._claim(limit=1, job_id=job_id)
+        return claimed[0] if claimed else None
+
+    def claim_ready_jobs(self, limit: int = 10) -> List[Job]:
+        """
+        Claim multiple ready jobs in batch.
+
+        Highest priority first, oldest scheduled_at breaking ties.
+
+        Args:
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            List[Job]: List of claimed jobs
+        """
+        return self._claim(limit=limit)
+
+    def _claim(self, limit: int, job_id: Optional[uuid.UUID] = None) -> List[Job]:
+        """
+        Claim up to limit ready jobs with one UPDATE ... RETURNING.
+
+        The rows are picked by a SELECT ... FOR UPDATE SKIP LOCKED subquery,
+        so finding, locking, updating and fetching the jobs is a single
+        statement, followed by one commit.
+
+        Args:
+            limit: Maximum number of jobs to claim
+            job_id: Optional specific job ID to claim
+
+        Returns:
+            List[Job]: Claimed jobs, highest priority first
+        """
         now = datetime.now(timezone.utc)
 
         # Subquery to find jobs with unmet dependencies
@@ -61,68 +93,38 @@ class Scheduler:
         if job_id:
             filters.append(Job.job_id == job_id)
 
-        # Query for pending jobs that are ready to be scheduled
         # Include dependency check in the query to avoid locking jobs that aren't ready
         # Use FOR UPDATE SKIP LOCKED to prevent concurrent claims
-        job = (
-            self.db.query(Job)
-            .filter(and_(*filters))
+        ready_jobs = (
+            select(Job.job_id)
+            .where(and_(*filters))
+            .order_by(Job.priority.desc(), Job.scheduled_at)
             .with_for_update(skip_locked=True)
-            .first()
-        )
-
-        if not job:
-            return None
-
-        # Claim the job
-        job.status = JobStatus.SCHEDULED
-        job.worker_id = self.worker_id
-        self.db.commit()
-
-        return job
-
-    def claim_ready_jobs(self, limit: int = 10) -> List[Job]:
-        """
-        Claim multiple ready jobs in batch.
-
-        Args:
-            limit: Maximum number of jobs to claim
-
-        Returns:
-            List[Job]: List of claimed jobs
-        """
-        now = datetime.now(timezone.utc)
-
-        # Subquery to find jobs with unmet dependencies
-        unmet_deps_subquery = (
-            select(job_dependencies.c.job_id)
-            .join(Job, Job.job_id == job_dependencies.c.depends_on_job_id)
-            .where(Job.status != JobStatus.SUCCESS)
+            .limit(limit)
         )
 
-        # Query for pending jobs with met dependencies
-        candidate_jobs = (
-            self.db.query(Job)
-            .filter(
-                and_(
-                    Job.status == JobStatus.PENDING,
-                    Job.scheduled_at <= now,
-                    ~Job.job_id.in_(unmet_deps_subquery)  # Only jobs with met dependencies
-                )
+        claimed_jobs = list(
+            self.db.scalars(
+                update(Job)
+                .where(Job.job_id.in_(ready_jobs.scalar_subquery()))
+                .values(status=JobStatus.SCHEDULED, worker_id=self.worker_id)
+                .returning(Job)
+                # The dependency check already ran in SQL, so skip the
+                # selectin relationship loads; they stay lazily available
+                .options(lazyload("*")),
+                execution_options={
+                    "synchronize_session": False,
+                    "populate_existing": True,
+                },
             )
-            .with_for_update(skip_locked=True)
-            .limit(limit)
-            .all()
         )
 
-        # Claim all candidate jobs
-        claimed_jobs = []
-        for job in candidate_jobs:
-            job.status = JobStatus.SCHEDULED
-            job.worker_id = self.worker_id
-            claimed_jobs.append(job)
+        if not claimed_jobs:
+            return []
 
-        if claimed_jobs:
-            self.db.commit()
+        # RETURNING order is unspecified; restore the claim order before the
+        # commit expires the attributes
+        claimed_jobs.sort(key=lambda job: (-job.priority, job.scheduled_at))
+        self.db.commit()
 
         return claimed_jobs
@@ -1,7 +1,7 @@
 """Async worker for concurrent job execution."""
 import asyncio
 import logging
-from typing import Optional, Set
+from typing import List, Optional, Set
 from uuid import UUID
 from sqlalchemy.orm import Session
 from schedora.worker.handler_registry import HandlerRegistry
@@ -82,12 +82,18 @@ class AsyncWorker:
         Start the worker polling loop.
 
         Continuously polls for jobs and executes them until stopped.
+        If the task running start() is cancelled, in-flight jobs are
+        cancelled too and the cancellation propagates to the caller.
         """
         self.is_running = True
         logger.info(f"Worker {self.worker_id} starting...")
 
         try:
             await self._poll_loop()
+        except asyncio.CancelledError:
+            for task in self._running_tasks:
+                task.cancel()
+            raise
         finally:
             self.is_running = False
             logger.info(f"Worker {self.worker_id} stopped")
@@ -123,10 +129,10 @@ class AsyncWorker:
         """
         while not self._stop_event.is_set():
             try:
-                # Claim job
-                job = await self._claim_job()
+                # Claim job(s)
+                jobs = await self._claim_jobs()
 
-                if job:
+                for job in jobs:
                     if self.use_test_session:
                         # Test mode: Execute synchronously in same thread
                         await self._execute_job_with_semaphore(job)
@@ -138,15 +144,41 @@ class AsyncWorker:
                         )
                         self._running_tasks.add(task)
                         task.add_done_callback(self._running_tasks.discard)
-                else:
+
+                if not jobs:
                     # No job available, wait before polling again
-                    await asyncio.sleep(self.poll_interval)
+                    await self._idle()
 
-            except asyncio.CancelledError:
-                break
             except Exception as e:
                 logger.error(f"Error in poll loop: {e}", exc_info=True)
-                await asyncio.sleep(self.poll_interval)
+                await self._idle()
+
+    async def _idle(self):
+        """Wait one poll interval, returning early as soon as stop() is called."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _claim_jobs(self) -> List[Job]:
+        """
+        Claim as many jobs as the worker has free slots for.
+
+        In production DB polling mode the free slots are filled with one
+        batched SKIP LOCKED claim. Redis queue mode and test mode claim a
+        single job per poll.
+
+        Returns:
+            List[Job]: Claimed jobs (empty if none available)
+        """
+        if self.queue or self.use_test_session:
+            job = await self._claim_job()
+            return [job] if job else []
+
+        free_slots = self.max_concurrent_jobs - len(self._running_tasks)
+        if free_slots <= 0:
+            return []
+        return await self._claim_batch_from_db(free_slots)
 
     async def _claim_job(self) -> Optional[Job]:
         """
@@ -185,31 +217,12 @@ class AsyncWorker:
         else:
             # Production: thread-safe
             def dequeue_and_claim_sync():
-                from schedora.core.database import SessionLocal
-                from schedora.services.scheduler import Scheduler
-
-                try:
-                    # Dequeue from Redis (thread-safe)
-                    job_id = self.queue.dequeue()
-                    if not job_id:
-                        return None
-
-                    # Claim from DB in separate session
-                    session = SessionLocal()
-                    try:
-                        scheduler = Scheduler(session, worker_id=self.worker_id)
-                        job = scheduler.claim_job(job_id=job_id)
-                        # Force load all attributes before expunging
-                        if job:
-                            _ = (job.job_id, job.type, job.payload, job.timeout_seconds,
-                                 job.status, job.max_retries, job.retry_count)
-                            session.expunge(job)
-                        return job
-                    finally:
-                        session.close()
-                except Exception as e:
-                    logger.error(f"Error in dequeue_and_claim_sync: {e}", exc_info=True)
+                # Dequeue from Redis (thread-safe)
+                job_id = self.queue.dequeue()
+                if not job_id:
                     return None
+                jobs = self._claim_detached(limit=1, job_id=job_id)
+                return jobs[0] if jobs else None
 
             try:
                 return await asyncio.to_thread(dequeue_and_claim_sync)
@@ -232,31 +245,60 @@ class AsyncWorker:
                 logger.error(f"Error claiming job: {e}", exc_info=True)
                 return None
         else:
-            # Production: create fresh session for thread safety
-            def claim_sync():
-                from schedora.core.database import SessionLocal
-                from schedora.services.scheduler import Scheduler
-                session = SessionLocal()
-                try:
-                    scheduler = Scheduler(session, worker_id=self.worker_id)
-                    job = scheduler.claim_job()
-                    # Force load all attributes before expunging
-                    if job:
-                        _ = (job.job_id, job.type, job.payload, job.timeout_seconds,
-                             job.status, job.max_retries, job.retry_count)
-                        session.expunge(job)
-                    return job
-                except Exception as e:
-                    logger.error(f"Error in claim_sync: {e}", exc_info=True)
-                    return None
-                finally:
-                    session.close()
+            # Production: a batch of one, claimed in a fresh session
+            jobs = await self._claim_batch_from_db(1)
+            return jobs[0] if jobs else None
 
-            try:
-                return await asyncio.to_thread(claim_sync)
-            except Exception as e:
-                logger.error(f"Error claiming job: {e}", exc_info=True)
-                return None
+    async def _claim_batch_from_db(self, limit: int) -> List[Job]:
+        """
+        Claim up to limit jobs from DB in one round trip (production mode).
+
+        Args:
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            List[Job]: Claimed jobs, detached from their session
+        """
+        try:
+            return await asyncio.to_thread(self._claim_detached, limit)
+        except Exception as e:
+            logger.error(f"Error claiming jobs: {e}", exc_info=True)
+            return []
+
+    def _claim_detached(self, limit: int, job_id: Optional[UUID] = None) -> List[Job]:
+        """
+        Claim jobs in a fresh session and detach them from it (production mode).
+
+        Runs in a worker thread, so it never touches the worker's own session.
+        The session keeps the state the claim's UPDATE ... RETURNING loaded,
+        so the claim commit does not cost a reload (and its selectin
+        relationship loads) per job before the jobs are expunged.
+
+        Args:
+            limit: Maximum number of jobs to claim
+            job_id: Optional specific job ID to claim
+
+        Returns:
+            List[Job]: Claimed jobs, detached from their session
+        """
+        from schedora.core.database import SessionLocal
+
+        session = SessionLocal(expire_on_commit=False)
+        try:
+            scheduler = Scheduler(session, worker_id=self.worker_id)
+            if job_id:
+                job = scheduler.claim_job(job_id=job_id)
+                jobs = [job] if job else []
+            else:
+                jobs = scheduler.claim_ready_jobs(limit=limit)
+            # Force load all attributes before expunging
+            for job in jobs:
+                _ = (job.job_id, job.type, job.payload, job.timeout_seconds,
+                     job.status, job.max_retries, job.retry_count)
+                session.expunge(job)
+            return jobs
+        finally:
+            session.close()
 
     async def _execute_job_with_semaphore(self, job: Job):
         """
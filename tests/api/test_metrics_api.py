@@ -1,5 +1,6 @@
 """API tests for Prometheus metrics endpoint."""
 import pytest
+from tests.factories.job_factory import unique_key
 
 
 @pytest.mark.api
@@ -76,10 +77,8 @@ class TestMetricsAPI:
         from schedora.services.redis_queue import RedisQueue
         from schedora.services.job_service import JobService
         from schedora.api.schemas.job import JobCreate
-        from uuid import uuid4
 
         queue = RedisQueue(redis_client)
-        queue.purge()
 
         # Create some jobs in queue
         job_service = JobService(db_session, queue=queue)
@@ -88,7 +87,7 @@ class TestMetricsAPI:
                 JobCreate(
                     type="echo",
                     payload={"index": i},
-                    idempotency_key=f"metrics-test-{uuid4()}",
+                    idempotency_key=unique_key("metrics-test"),
                 )
             )
 
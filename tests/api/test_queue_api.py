@@ -1,9 +1,9 @@
 """API tests for queue management endpoints."""
 import pytest
-from uuid import uuid4
 from schedora.services.redis_queue import RedisQueue
 from schedora.services.job_service import JobService
 from schedora.api.schemas.job import JobCreate
+from tests.factories.job_factory import unique_key
 
 
 @pytest.mark.api
@@ -13,8 +13,6 @@ class TestQueueAPI:
     def test_get_queue_stats(self, client, db_session, redis_client):
         """Test GET /api/v1/queue/stats endpoint."""
         queue = RedisQueue(redis_client)
-        queue.purge()
-        queue.purge_dlq()
 
         # Create some jobs
         job_service = JobService(db_session, queue=queue)
@@ -23,7 +21,7 @@ class TestQueueAPI:
                 JobCreate(
                     type="echo",
                     payload={"index": i},
-                    idempotency_key=f"stats-test-{uuid4()}",
+                    idempotency_key=unique_key("stats-test"),
                 )
             )
 
@@ -32,7 +30,7 @@ class TestQueueAPI:
             JobCreate(
                 type="echo",
                 payload={"test": "dlq"},
-                idempotency_key=f"dlq-test-{uuid4()}",
+                idempotency_key=unique_key("dlq-test"),
             )
         )
         queue.move_to_dlq(job.job_id, "Test DLQ")
@@ -47,7 +45,6 @@ class TestQueueAPI:
     def test_purge_queue(self, client, db_session, redis_client):
         """Test POST /api/v1/queue/purge endpoint."""
         queue = RedisQueue(redis_client)
-        queue.purge()
 
         # Create some jobs
         job_service = JobService(db_session, queue=queue)
@@ -56,7 +53,7 @@ class TestQueueAPI:
                 JobCreate(
                     type="echo",
                     payload={"index": i},
-                    idempotency_key=f"purge-test-{uuid4()}",
+                    idempotency_key=unique_key("purge-test"),
                 )
             )
 
@@ -72,8 +69,6 @@ class TestQueueAPI:
     def test_purge_dlq(self, client, db_session, redis_client):
         """Test POST /api/v1/queue/dlq/purge endpoint."""
         queue = RedisQueue(redis_client)
-        queue.purge()
-        queue.purge_dlq()
 
         # Create jobs and move to DLQ
         job_service = JobService(db_session, queue=queue)
@@ -82,7 +77,7 @@ class TestQueueAPI:
                 JobCreate(
                     type="echo",
                     payload={"index": i},
-                    idempotency_key=f"dlq-purge-test-{uuid4()}",
+                    idempotency_key=unique_key("dlq-purge-test"),
                 )
             )
             queue.move_to_dlq(job.job_id, f"Test error {i}")
@@ -99,7 +94,6 @@ class TestQueueAPI:
     def test_peek_next_job(self, client, db_session, redis_client):
         """Test GET /api/v1/queue/peek endpoint."""
         queue = RedisQueue(redis_client)
-        queue.purge()
 
         # Create jobs with different priorities
         job_service = JobService(db_session, queue=queue)
@@ -107,7 +101,7 @@ class TestQueueAPI:
             JobCreate(
                 type="echo",
                 payload={"priority": "low"},
-                idempotency_key=f"low-{uuid4()}",
+                idempotency_key=unique_key("low"),
                 priority=1,
             )
         )
@@ -115,7 +109,7 @@ class TestQueueAPI:
             JobCreate(
                 type="echo",
                 payload={"priority": "high"},
-                idempotency_key=f"high-{uuid4()}",
+                idempotency_key=unique_key("high"),
                 priority=10,
             )
         )
@@ -129,9 +123,7 @@ class TestQueueAPI:
 
     def test_peek_empty_queue(self, client, redis_client):
         """Test peeking at empty queue."""
-        queue = RedisQueue(redis_client)
-        queue.purge()
-
+        # redis_client flushes the database, so the queue starts empty
         response = client.get("/api/v1/queue/peek")
 
         assert response.status_code == 404
@@ -1,8 +1,11 @@
 """Shared pytest fixtures for all tests."""
 import os
+import sqlite3
 import pytest
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 from schedora.core.database import Base
 from schedora.config import get_settings
 
@@ -14,38 +17,80 @@ from schedora.models.job import Job  # noqa: F401
 from schedora.models.workflow import Workflow  # noqa: F401
 from schedora.models.worker import Worker  # noqa: F401
 
+# pytest-xdist worker name ("gw0", "gw1", ...), empty when running serially.
+# Each xdist worker gets its own Postgres schema and Redis database so that
+# parallel workers never see each other's rows or keys.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+TEST_SCHEMA = f"test_{XDIST_WORKER}" if XDIST_WORKER else None
+
+if XDIST_WORKER:
+    _settings = get_settings()
+    _redis_base, _, _ = _settings.REDIS_URL.rpartition("/")
+    _settings.REDIS_URL = f"{_redis_base}/{int(XDIST_WORKER.removeprefix('gw')) % 16}"
+
+    @event.listens_for(Engine, "connect")
+    def _set_worker_search_path(dbapi_connection, connection_record):
+        """Point every new connection (test and app engines) at the worker schema."""
+        if isinstance(dbapi_connection, sqlite3.Connection):
+            return
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f'SET search_path TO "{TEST_SCHEMA}"')
+        cursor.close()
+
 
 @pytest.fixture(autouse=True)
-def reset_redis_clients():
+def reset_redis_clients(redis_session_client):
     """
     Reset Redis client singletons before each test.
 
-    This ensures each test gets a fresh Redis connection,
-    preventing event loop issues with async Redis clients.
+    The sync singleton is pointed at the session-wide client, so get_redis()
+    reuses one connection pool across tests, and any mock a test installed
+    is discarded afterwards. The async client is cleared so each test gets
+    a fresh one, preventing event loop issues with async Redis clients.
     """
     from schedora.core import redis as redis_module
 
-    # Reset both sync and async Redis client singletons
-    redis_module._redis_client = None
+    redis_module._redis_client = redis_session_client
     redis_module._async_redis_client = None
 
     yield
 
     # Cleanup after test
-    redis_module._redis_client = None
+    redis_module._redis_client = redis_session_client
     redis_module._async_redis_client = None
 
 
+@pytest.fixture(scope="session")
+def redis_session_client():
+    """
+    Provide one Redis client (and connection pool) for the whole session.
+
+    reset_redis_clients installs it as the get_redis() singleton before
+    every test.
+    """
+    from redis import Redis
+
+    client = Redis.from_url(
+        get_settings().REDIS_URL,
+        decode_responses=True,
+        socket_connect_timeout=5,
+        socket_keepalive=True,
+    )
+
+    yield client
+
+    client.close()
+
+
 @pytest.fixture
-def redis_client():
+def redis_client(redis_session_client):
     """
     Provide a Redis client for tests.
 
-    Flushes the test database before and after each test for isolation.
+    Flushes the test database before and after each test for isolation,
+    so tests never need to purge their queues themselves.
     """
-    from schedora.core.redis import get_redis
-
-    client = get_redis()
+    client = redis_session_client
 
     # Flush before test
     client.flushdb()
@@ -61,14 +106,27 @@ def test_engine():
     """
     Create test database engine for the session.
 
-    Creates all tables at the start and drops them at the end.
+    Creates all tables at the start and drops them at the end. Under
+    pytest-xdist the tables live in a per-worker schema.
     """
     settings = get_settings()
+    # Each xdist worker is its own process with its own engine, so the pool
+    # only serves that worker's tests; size it for one test plus the app
+    # sessions it opens rather than scaling with the worker count.
     engine = create_engine(
         settings.TEST_DATABASE_URL or settings.DATABASE_URL,
         echo=False,
+        pool_size=5,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=3600,
     )
 
+    if TEST_SCHEMA:
+        with engine.begin() as conn:
+            conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{TEST_SCHEMA}"'))
+
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
@@ -76,35 +134,86 @@ def test_engine():
 
     # Drop all tables
     Base.metadata.drop_all(bind=engine)
+    if TEST_SCHEMA:
+        with engine.begin() as conn:
+            conn.execute(text(f'DROP SCHEMA IF EXISTS "{TEST_SCHEMA}" CASCADE'))
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine():
+    """
+    Create an in-memory SQLite engine for model/repository tests.
+
+    StaticPool keeps the single in-memory connection alive for the whole
+    session, so the tables created here stay visible to every test.
+    """
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN itself so the rollback-per-test pattern below works.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+
+    yield engine
+
     engine.dispose()
 
 
 @pytest.fixture(scope="function")
-def db_session(test_engine):
+def db_session(request):
     """
     Create a new database session for a test.
 
     Uses transaction rollback for test isolation - each test runs
     in a transaction that is rolled back after the test completes.
     This is fast and ensures tests don't interfere with each other.
+
+    Tests marked ``sqlite`` run against the in-memory SQLite engine
+    unless they are also marked ``requires_postgres``; everything else
+    uses the PostgreSQL test database.
     """
-    connection = test_engine.connect()
-    transaction = connection.begin()
-    session = Session(bind=connection)
+    node = request.node
+    if node.get_closest_marker("sqlite") and not node.get_closest_marker("requires_postgres"):
+        engine = request.getfixturevalue("sqlite_engine")
+    else:
+        engine = request.getfixturevalue("test_engine")
 
-    # Begin a nested transaction (using SAVEPOINT)
-    nested = connection.begin_nested()
+    connection = engine.connect()
+    transaction = connection.begin()
 
-    # If the application code calls session.commit, it will only commit
-    # the nested transaction (SAVEPOINT), not the outer one
-    @event.listens_for(session, "after_transaction_end")
-    def restart_savepoint(session, transaction):
-        if transaction.nested and not transaction._parent.nested:
-            session.expire_all()
-            session.begin_nested()
+    # If the application code calls session.commit or session.rollback, it
+    # only releases or rolls back a SAVEPOINT, never the outer transaction
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     yield session
 
     session.close()
     transaction.rollback()
     connection.close()
+
+
+@pytest.fixture
+def no_expire_on_commit(db_session):
+    """
+    Keep loaded objects usable after db_session commits.
+
+    For tests whose code under test writes through db_session itself, so
+    in-memory state is already current and a reload SELECT is wasted.
+    Not the default: repository paths using bulk UPDATEs with
+    synchronize_session=False rely on commit-time expiry.
+    """
+    db_session.expire_on_commit = False
+    yield db_session
+    db_session.expire_on_commit = True
@@ -1,11 +1,31 @@
 """Test factory for creating Job instances."""
+import itertools
 from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
 from uuid import uuid4
-from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 from schedora.models.job import Job
 from schedora.core.enums import JobStatus, RetryPolicy
 
+# Shared by every test in the process. The token is drawn once per process,
+# so keys stay unique across xdist workers and across runs whose leftover
+# committed rows survived an interrupted teardown.
+_key_counter = itertools.count()
+_key_scope = uuid4().hex[:8]
+
+
+def unique_key(prefix: str = "test") -> str:
+    """
+    Return an idempotency key unique across test processes and runs.
+
+    Args:
+        prefix: Human-readable prefix for the key
+
+    Returns:
+        str: Key of the form ``{prefix}-{token}-{n}``
+    """
+    return f"{prefix}-{_key_scope}-{next(_key_counter)}"
+
 
 def create_job(
     db: Session,
@@ -37,13 +57,64 @@ def create_job(
     Returns:
         Job: Created job instance
     """
+    job = _build_job(
+        job_type=job_type,
+        payload=payload,
+        priority=priority,
+        status=status,
+        max_retries=max_retries,
+        retry_count=retry_count,
+        retry_policy=retry_policy,
+        idempotency_key=idempotency_key,
+        **kwargs
+    )
+
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    return job
+
+
+def create_jobs(db: Session, specs: List[Dict[str, Any]]) -> List[Job]:
+    """
+    Factory function to create several Jobs with a single flush and commit.
+
+    Args:
+        db: Database session
+        specs: One dict of create_job keyword arguments per job
+
+    Returns:
+        List[Job]: Created job instances, in the order of specs
+    """
+    jobs = [_build_job(**spec) for spec in specs]
+
+    # add_all flushes as one batched INSERT rather than a round trip per job
+    db.add_all(jobs)
+    db.commit()
+
+    return jobs
+
+
+def _build_job(
+    job_type: str = "test_job",
+    payload: Optional[Dict[str, Any]] = None,
+    priority: int = 5,
+    status: JobStatus = JobStatus.PENDING,
+    max_retries: int = 3,
+    retry_count: int = 0,
+    retry_policy: RetryPolicy = RetryPolicy.EXPONENTIAL,
+    idempotency_key: Optional[str] = None,
+    **kwargs
+) -> Job:
+    """Build an unsaved Job with the create_job defaults."""
     if payload is None:
         payload = {}
 
     if idempotency_key is None:
-        idempotency_key = f"test-key-{uuid4()}"
+        idempotency_key = unique_key("test-key")
 
-    job = Job(
+    return Job(
         type=job_type,
         payload=payload,
         priority=priority,
@@ -55,9 +126,3 @@ def create_job(
         scheduled_at=kwargs.pop("scheduled_at", datetime.now(timezone.utc)),
         **kwargs
     )
-
-    db.add(job)
-    db.commit()
-    db.refresh(job)
-
-    return job
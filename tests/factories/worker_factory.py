@@ -0,0 +1,29 @@
+"""Test factory for creating Worker instances."""
+from typing import Any, Dict, List
+from sqlalchemy.orm import Session
+from schedora.models.worker import Worker
+
+
+def create_workers(db: Session, specs: List[Dict[str, Any]]) -> List[Worker]:
+    """
+    Factory function to create several Workers with a single flush and commit.
+
+    Each spec holds Worker column values, including any final status or
+    timestamps, so no follow-up UPDATE is needed. hostname, pid and
+    version default to placeholder values.
+
+    Args:
+        db: Database session
+        specs: One dict of Worker column values per worker (worker_id required)
+
+    Returns:
+        List[Worker]: Created worker instances, in the order of specs
+    """
+    workers = [
+        Worker(**{"hostname": "test-host", "pid": 1, "version": "0.1.0", **spec})
+        for spec in specs
+    ]
+    db.add_all(workers)
+    db.commit()
+
+    return workers
@@ -0,0 +1,24 @@
+"""Fixtures for integration tests."""
+import pytest
+from schedora.worker.handler_registry import HandlerRegistry
+from schedora.worker.handlers.echo_handler import echo_handler
+from schedora.worker.handlers.fail_handler import fail_handler
+from schedora.worker.handlers.sleep_handler import sleep_handler
+
+
+@pytest.fixture
+def handler_registry():
+    """
+    Provide a fresh handler registry for each test.
+
+    Comes prebuilt with the echo, sleep and fail handlers. Tests that need
+    additional handlers build their own HandlerRegistry.
+
+    Returns:
+        HandlerRegistry: Registry with the built-in test handlers
+    """
+    registry = HandlerRegistry()
+    registry.register_handler("sleep", sleep_handler)
+    registry.register_handler("echo", echo_handler)
+    registry.register_handler("fail", fail_handler)
+    return registry
@@ -0,0 +1,70 @@
+"""Shared helpers for integration tests."""
+import asyncio
+from typing import Iterable
+from uuid import UUID
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from schedora.core.enums import JobStatus
+from schedora.models.job import Job
+
+
+async def wait_for_status(
+    session: Session, job_id: UUID, status: JobStatus, timeout: float = 2.0
+) -> None:
+    """
+    Poll a job's status column until it reaches status.
+
+    Reads only the status column, so nothing loaded in session is refreshed
+    while a worker is still running against it.
+
+    Args:
+        session: Session to poll through
+        job_id: Job to watch
+        status: Status to wait for
+        timeout: Seconds to wait before failing
+
+    Raises:
+        asyncio.TimeoutError: If the job does not reach status in time
+    """
+    async def poll():
+        while True:
+            current = session.execute(
+                select(Job.status).where(Job.job_id == job_id)
+            ).scalar_one_or_none()
+            if current == status:
+                return
+            await asyncio.sleep(0.02)
+
+    await asyncio.wait_for(poll(), timeout=timeout)
+
+
+async def wait_for_all_status(
+    session: Session, job_ids: Iterable[UUID], status: JobStatus, timeout: float = 2.0
+) -> None:
+    """
+    Poll until every job in job_ids has reached status.
+
+    Each poll is a single COUNT over the whole batch rather than one
+    query per job.
+
+    Args:
+        session: Session to poll through
+        job_ids: Jobs to watch
+        status: Status to wait for
+        timeout: Seconds to wait before failing
+
+    Raises:
+        asyncio.TimeoutError: If any job does not reach status in time
+    """
+    job_ids = list(job_ids)
+    pending = (
+        select(func.count())
+        .select_from(Job)
+        .where(Job.job_id.in_(job_ids), Job.status != status)
+    )
+
+    async def poll():
+        while session.execute(pending).scalar_one():
+            await asyncio.sleep(0.02)
+
+    await asyncio.wait_for(poll(), timeout=timeout)
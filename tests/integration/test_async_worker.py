@@ -4,6 +4,7 @@ import asyncio
 from datetime import datetime, timezone
 from uuid import uuid4
 from schedora.core.enums import JobStatus
+from tests.factories.job_factory import unique_key
 
 
 @pytest.mark.integration
@@ -35,6 +36,49 @@ class TestAsyncWorker:
 
         assert worker.is_running is False
 
+    async def test_worker_stop_interrupts_idle_wait(self, db_session):
+        """Test stop() wakes an idle worker instead of waiting out poll_interval."""
+        from schedora.worker.async_worker import AsyncWorker
+        from schedora.worker.handler_registry import HandlerRegistry
+
+        worker = AsyncWorker(
+            worker_id="test-worker-idle",
+            db_session=db_session,
+            handler_registry=HandlerRegistry(),
+            poll_interval=60,
+            use_test_session=True,
+        )
+
+        worker_task = asyncio.create_task(worker.start())
+        await asyncio.sleep(0)  # Let it reach the idle wait
+
+        await worker.stop()
+        await asyncio.wait_for(worker_task, timeout=1.0)
+
+        assert worker.is_running is False
+
+    async def test_worker_cancellation_propagates(self, db_session):
+        """Test cancelling the start() task stops the worker and re-raises."""
+        from schedora.worker.async_worker import AsyncWorker
+        from schedora.worker.handler_registry import HandlerRegistry
+
+        worker = AsyncWorker(
+            worker_id="test-worker-cancel",
+            db_session=db_session,
+            handler_registry=HandlerRegistry(),
+            poll_interval=60,
+            use_test_session=True,
+        )
+
+        worker_task = asyncio.create_task(worker.start())
+        await asyncio.sleep(0)
+
+        worker_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await worker_task
+
+        assert worker.is_running is False
+
     async def test_worker_claims_and_executes_job(self, db_session):
         """Test worker claims and executes a job."""
         from schedora.worker.async_worker import AsyncWorker
@@ -47,7 +91,7 @@ class TestAsyncWorker:
             job_id=uuid4(),
             type="echo",
             payload={"message": "test"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.PENDING,
         )
         db_session.add(job)
@@ -88,17 +132,17 @@ class TestAsyncWorker:
         from schedora.models.job import Job
 
         # Create 5 jobs
-        jobs = []
-        for i in range(5):
-            job = Job(
+        jobs = [
+            Job(
                 job_id=uuid4(),
                 type="sleep",
                 payload={"duration": 0.5},
                 idempotency_key=f"test-concurrent-{i}",
                 status=JobStatus.PENDING,
             )
-            jobs.append(job)
-            db_session.add(job)
+            for i in range(5)
+        ]
+        db_session.add_all(jobs)
         db_session.commit()
 
         # Setup worker with max 2 concurrent jobs
@@ -170,15 +214,16 @@ class TestAsyncWorker:
         from schedora.models.job import Job
 
         # Create test jobs
-        for i in range(3):
-            job = Job(
+        db_session.add_all([
+            Job(
                 job_id=uuid4(),
                 type="echo",
                 payload={"index": i},
                 idempotency_key=f"test-metrics-{i}",
                 status=JobStatus.PENDING,
             )
-            db_session.add(job)
+            for i in range(3)
+        ])
         db_session.commit()
 
         # Setup worker
@@ -6,6 +6,7 @@ from schedora.services.background_tasks import BackgroundTaskManager
 from schedora.services.heartbeat_service import HeartbeatService
 from schedora.repositories.worker_repository import WorkerRepository
 from schedora.core.enums import WorkerStatus
+from schedora.models.worker import Worker
 
 
 @pytest.mark.asyncio
@@ -274,16 +275,19 @@ class TestBackgroundTaskManager:
         repo = WorkerRepository(db_session)
 
         # Create 3 old stopped workers
-        for i in range(3):
-            worker = repo.create(
+        stopped_at = datetime.now(timezone.utc) - timedelta(hours=2)
+        db_session.add_all([
+            Worker(
                 worker_id=f"log-test-worker-{i}",
                 hostname="host",
                 pid=1000 + i,
                 version="1.0.0",
                 max_concurrent_jobs=5,
                 status=WorkerStatus.STOPPED,
+                stopped_at=stopped_at,
             )
-            worker.stopped_at = datetime.now(timezone.utc) - timedelta(hours=2)
+            for i in range(3)
+        ])
         db_session.commit()
 
         # Run one iteration of the cleanup task manually
@@ -4,6 +4,7 @@ import asyncio
 from datetime import datetime, timezone
 from uuid import uuid4
 from schedora.core.enums import JobStatus
+from tests.factories.job_factory import unique_key
 
 
 @pytest.mark.integration
@@ -20,7 +21,7 @@ class TestDatabaseAdapterIntegration:
             job_id=uuid4(),
             type="test_job",
             payload={"test": "data"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.PENDING,
         )
         db_session.add(job)
@@ -41,17 +42,17 @@ class TestDatabaseAdapterIntegration:
         from schedora.models.job import Job
 
         # Create multiple jobs
-        jobs = []
-        for i in range(3):
-            job = Job(
+        jobs = [
+            Job(
                 job_id=uuid4(),
                 type="test_job",
                 payload={"index": i},
                 idempotency_key=f"test-concurrent-{i}",
                 status=JobStatus.PENDING,
             )
-            jobs.append(job)
-            db_session.add(job)
+            for i in range(3)
+        ]
+        db_session.add_all(jobs)
         db_session.commit()
 
         # Query them concurrently using asyncio.to_thread
@@ -79,7 +80,7 @@ class TestDatabaseAdapterIntegration:
             job_id=uuid4(),
             type="test_job",
             payload={"test": "data"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.RUNNING,
         )
         db_session.add(job)
@@ -109,7 +110,7 @@ class TestDatabaseAdapterIntegration:
             job_id=uuid4(),
             type="test_job",
             payload={"test": "data"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.PENDING,
         )
         db_session.add(job)
@@ -2,60 +2,62 @@
 import pytest
 from schedora.services.dependency_resolver import DependencyResolver
 from schedora.core.enums import JobStatus
+from schedora.models.job import Job
 from tests.factories.job_factory import create_job
 
+pytestmark = pytest.mark.usefixtures("no_expire_on_commit")
 
-class TestDependencyResolver:
-    """Test dependency resolution logic."""
 
-    def test_job_with_no_dependencies_is_ready(self, db_session):
-        """Test job with no dependencies is ready to execute."""
-        resolver = DependencyResolver(db_session)
-        job = create_job(db_session, job_type="standalone", idempotency_key="no-deps-1")
+@pytest.fixture
+def job_with_deps(db_session):
+    """
+    Build a main job with one dependency per given status.
 
-        assert resolver.are_dependencies_met(job) is True
+    All rows are added together and written with a single flush instead
+    of one commit/refresh round trip per job.
+    """
 
-    def test_job_with_successful_dependencies_is_ready(self, db_session):
-        """Test job is ready when all dependencies succeeded."""
-        resolver = DependencyResolver(db_session)
+    def build(*dep_statuses: JobStatus) -> Job:
+        deps = [
+            Job(type=f"dep{i}", status=status, idempotency_key=f"dep-{i}")
+            for i, status in enumerate(dep_statuses, start=1)
+        ]
+        job = Job(type="main_job", idempotency_key="main-1", dependencies=deps)
+        db_session.add_all([*deps, job])
+        db_session.flush()
+        return job
 
-        dep1 = create_job(db_session, job_type="dep1", status=JobStatus.SUCCESS, idempotency_key="dep-1")
-        dep2 = create_job(db_session, job_type="dep2", status=JobStatus.SUCCESS, idempotency_key="dep-2")
+    return build
 
-        job = create_job(db_session, job_type="main_job", idempotency_key="main-1")
-        job.dependencies.append(dep1)
-        job.dependencies.append(dep2)
-        db_session.commit()
 
-        assert resolver.are_dependencies_met(job) is True
+class TestDependencyResolver:
+    """Test dependency resolution logic."""
 
-    def test_job_with_pending_dependency_not_ready(self, db_session):
-        """Test job not ready when dependency is still pending."""
+    def test_job_with_no_dependencies_is_ready(self, db_session):
+        """Test job with no dependencies is ready to execute."""
         resolver = DependencyResolver(db_session)
+        job = create_job(db_session, job_type="standalone", idempotency_key="no-deps-1")
 
-        dep1 = create_job(db_session, job_type="dep1", status=JobStatus.SUCCESS, idempotency_key="dep-success")
-        dep2 = create_job(db_session, job_type="dep2", status=JobStatus.RUNNING, idempotency_key="dep-running")
-
-        job = create_job(db_session, job_type="main_job", idempotency_key="main-2")
-        job.dependencies.append(dep1)
-        job.dependencies.append(dep2)
-        db_session.commit()
-
-        assert resolver.are_dependencies_met(job) is False
+        assert resolver.are_dependencies_met(job) is True
 
-    def test_job_with_failed_dependency_not_ready(self, db_session):
-        """Test job not ready when dependency failed."""
+    @pytest.mark.parametrize(
+        "dep1_status,dep2_status,expected_met,expected_failed",
+        [
+            (JobStatus.SUCCESS, JobStatus.SUCCESS, True, False),
+            (JobStatus.SUCCESS, JobStatus.RUNNING, False, False),
+            (JobStatus.SUCCESS, JobStatus.FAILED, False, True),
+            (JobStatus.SUCCESS, JobStatus.DEAD, False, True),
+        ],
+    )
+    def test_dependency_status_combinations(
+        self, db_session, job_with_deps, dep1_status, dep2_status, expected_met, expected_failed
+    ):
+        """Test readiness and failure detection for a job with two dependencies."""
         resolver = DependencyResolver(db_session)
+        job = job_with_deps(dep1_status, dep2_status)
 
-        dep1 = create_job(db_session, job_type="dep1", status=JobStatus.SUCCESS, idempotency_key="dep-ok")
-        dep2 = create_job(db_session, job_type="dep2", status=JobStatus.FAILED, idempotency_key="dep-failed")
-
-        job = create_job(db_session, job_type="main_job", idempotency_key="main-3")
-        job.dependencies.append(dep1)
-        job.dependencies.append(dep2)
-        db_session.commit()
-
-        assert resolver.are_dependencies_met(job) is False
+        assert resolver.are_dependencies_met(job) is expected_met
+        assert resolver.has_failed_dependencies(job) is expected_failed
 
     def test_get_ready_jobs_returns_jobs_with_met_dependencies(self, db_session):
         """Test get_ready_jobs returns only jobs ready to execute."""
@@ -79,7 +81,7 @@ class TestDependencyResolver:
         # Job 4: Already running (not ready)
         job4 = create_job(db_session, job_type="job4", status=JobStatus.RUNNING, idempotency_key="j4")
 
-        db_session.commit()
+        db_session.flush()
 
         ready_jobs = resolver.get_ready_jobs()
 
@@ -89,34 +91,6 @@ class TestDependencyResolver:
         assert job3 not in ready_jobs
         assert job4 not in ready_jobs
 
-    def test_has_failed_dependencies(self, db_session):
-        """Test checking if job has failed dependencies."""
-        resolver = DependencyResolver(db_session)
-
-        dep_ok = create_job(db_session, job_type="dep", status=JobStatus.SUCCESS, idempotency_key="dep-ok-1")
-        dep_failed = create_job(db_session, job_type="dep", status=JobStatus.DEAD, idempotency_key="dep-dead")
-
-        job = create_job(db_session, job_type="main", idempotency_key="main-4")
-        job.dependencies.append(dep_ok)
-        job.dependencies.append(dep_failed)
-        db_session.commit()
-
-        assert resolver.has_failed_dependencies(job) is True
-
-    def test_no_failed_dependencies(self, db_session):
-        """Test job with no failed dependencies."""
-        resolver = DependencyResolver(db_session)
-
-        dep1 = create_job(db_session, job_type="dep", status=JobStatus.SUCCESS, idempotency_key="dep-ok-2")
-        dep2 = create_job(db_session, job_type="dep", status=JobStatus.RUNNING, idempotency_key="dep-run")
-
-        job = create_job(db_session, job_type="main", idempotency_key="main-5")
-        job.dependencies.append(dep1)
-        job.dependencies.append(dep2)
-        db_session.commit()
-
-        assert resolver.has_failed_dependencies(job) is False
-
     def test_get_blocked_jobs(self, db_session):
         """Test getting jobs blocked by failed dependencies."""
         resolver = DependencyResolver(db_session)
@@ -146,7 +120,7 @@ class TestDependencyResolver:
         # Job 5: Not blocked (no dependencies)
         job5 = create_job(db_session, job_type="job5", status=JobStatus.PENDING, idempotency_key="not-blocked-2")
 
-        db_session.commit()
+        db_session.flush()
 
         blocked_jobs = resolver.get_blocked_jobs()
 
@@ -9,13 +9,24 @@ from schedora.models.job import Job
 from schedora.models.worker import Worker
 from schedora.worker.async_worker import AsyncWorker
 from schedora.worker.handler_registry import HandlerRegistry
-from schedora.worker.handlers.echo_handler import echo_handler
 from schedora.repositories.worker_repository import WorkerRepository
 from schedora.services.job_service import JobService
 from schedora.services.workflow_service import WorkflowService
 from schedora.services.retry_service import RetryService
 from schedora.core.enums import RetryPolicy
-from tests.factories.job_factory import create_job
+from tests.factories.job_factory import create_job, unique_key
+
+
+def _make_worker(db_session, registry, worker_id: str, **kwargs) -> AsyncWorker:
+    """Build a test-session AsyncWorker with the defaults shared by these tests."""
+    return AsyncWorker(
+        worker_id=worker_id,
+        db_session=db_session,
+        handler_registry=registry,
+        max_concurrent_jobs=5,
+        use_test_session=True,
+        **kwargs,
+    )
 
 
 @pytest.mark.integration
@@ -25,25 +36,23 @@ class TestAsyncWorkerErrorPaths:
 
     async def test_worker_stop_with_timeout(self, db_session):
         """Test worker stop with tasks that timeout."""
-        from schedora.worker.handlers.sleep_handler import sleep_handler
+        job_started = asyncio.Event()
+
+        async def instrumented_sleep_handler(payload):
+            job_started.set()
+            await asyncio.sleep(payload["duration"])
 
         registry = HandlerRegistry()
-        registry.register_handler("sleep", sleep_handler)
-
-        worker = AsyncWorker(
-            worker_id="timeout-test",
-            db_session=db_session,
-            handler_registry=registry,
-            max_concurrent_jobs=5,
-            use_test_session=True,
-        )
+        registry.register_handler("instrumented_sleep", instrumented_sleep_handler)
+
+        worker = _make_worker(db_session, registry, "timeout-test")
 
         # Create long-running job
         job = Job(
             job_id=uuid4(),
-            type="sleep",
+            type="instrumented_sleep",
             payload={"duration": 10},  # 10 seconds
-            idempotency_key=f"timeout-{uuid4()}",
+            idempotency_key=unique_key("timeout"),
             status=JobStatus.PENDING,
         )
         db_session.add(job)
@@ -51,7 +60,7 @@ class TestAsyncWorkerErrorPaths:
 
         # Start worker and quickly stop with short timeout
         worker_task = asyncio.create_task(worker.start())
-        await asyncio.sleep(0.2)  # Let job start
+        await asyncio.wait_for(job_started.wait(), timeout=1.0)  # Let job start
 
         # Stop with very short timeout to trigger TimeoutError path
         await worker.stop(timeout=0.01)
@@ -63,21 +72,13 @@ class TestAsyncWorkerErrorPaths:
 
         assert not worker.is_running
 
-    async def test_worker_claim_job_error_in_test_mode(self, db_session):
+    async def test_worker_claim_job_error_in_test_mode(self, db_session, handler_registry):
         """Test claim_job error handling in test mode."""
-        registry = HandlerRegistry()
-
         # Mock scheduler to raise an exception
         mock_scheduler = Mock()
         mock_scheduler.claim_job.side_effect = Exception("Test claim error")
 
-        worker = AsyncWorker(
-            worker_id="claim-error-test",
-            db_session=db_session,
-            handler_registry=registry,
-            max_concurrent_jobs=5,
-            use_test_session=True,
-        )
+        worker = _make_worker(db_session, handler_registry, "claim-error-test")
         worker.scheduler = mock_scheduler
 
         # Claim should return None on error
@@ -97,19 +98,14 @@ class TestAsyncWorkerErrorPaths:
             job_id=uuid4(),
             type="bad",
             payload={},
-            idempotency_key=f"bad-{uuid4()}",
+            idempotency_key=unique_key("bad"),
             status=JobStatus.PENDING,
         )
         db_session.add(job)
         db_session.commit()
 
-        worker = AsyncWorker(
-            worker_id="unexpected-error-test",
-            db_session=db_session,
-            handler_registry=registry,
-            max_concurrent_jobs=5,
-            poll_interval=0.1,
-            use_test_session=True,
+        worker = _make_worker(
+            db_session, registry, "unexpected-error-test", poll_interval=0.1
         )
 
         # Execute job - should handle the unexpected error
@@ -4,6 +4,7 @@ import asyncio
 from datetime import datetime, timezone, timedelta
 from uuid import uuid4
 from schedora.core.enums import JobStatus, WorkerStatus
+from tests.factories.job_factory import unique_key
 
 
 @pytest.mark.integration
@@ -40,8 +41,8 @@ class TestHeartbeatService:
 
         # Verify Redis heartbeat key
         heartbeat_key = f"worker:{worker_id}:heartbeat"
-        assert redis_client.exists(heartbeat_key) == 1
-        ttl = redis_client.ttl(heartbeat_key)
+        exists, ttl = redis_client.pipeline().exists(heartbeat_key).ttl(heartbeat_key).execute()
+        assert exists == 1
         assert ttl > 0
 
     def test_send_heartbeat_updates_redis_and_db(self, db_session, redis_client):
@@ -67,7 +68,7 @@ class TestHeartbeatService:
         assert ttl > 80  # Should be close to timeout value
 
         # Verify DB timestamp updated
-        db_session.refresh(worker)
+        db_session.expire(worker, ["status", "last_heartbeat_at", "stopped_at"])
         assert worker.last_heartbeat_at is not None
 
     def test_detect_stale_workers(self, db_session, redis_client):
@@ -92,7 +93,7 @@ class TestHeartbeatService:
         # Verify worker marked as stale
         assert len(stale_workers) == 1
         assert stale_workers[0].worker_id == worker_id
-        db_session.refresh(worker)
+        db_session.expire(worker, ["status", "last_heartbeat_at", "stopped_at"])
         assert worker.status == WorkerStatus.STALE
 
     def test_assign_and_remove_job_from_worker(self, db_session, redis_client):
@@ -165,11 +166,14 @@ class TestHeartbeatService:
         # Verify Redis keys removed
         heartbeat_key = f"worker:{worker_id}:heartbeat"
         jobs_key = f"worker:{worker_id}:jobs"
-        assert redis_client.exists(heartbeat_key) == 0
-        assert redis_client.exists(jobs_key) == 0
+        heartbeat_exists, jobs_exists = (
+            redis_client.pipeline().exists(heartbeat_key).exists(jobs_key).execute()
+        )
+        assert heartbeat_exists == 0
+        assert jobs_exists == 0
 
         # Verify worker marked as STOPPED
-        db_session.refresh(worker)
+        db_session.expire(worker, ["status", "last_heartbeat_at", "stopped_at"])
         assert worker.status == WorkerStatus.STOPPED
         assert worker.stopped_at is not None
 
@@ -185,19 +189,19 @@ class TestHeartbeatService:
         service.register_worker(worker_id, "host", 123, 5)
 
         # Create jobs assigned to worker
-        jobs = []
-        for i in range(3):
-            job = Job(
+        jobs = [
+            Job(
                 job_id=uuid4(),
                 type="test",
                 payload={"index": i},
-                idempotency_key=f"test-{uuid4()}",
+                idempotency_key=unique_key("test"),
                 status=JobStatus.RUNNING,
             )
-            jobs.append(job)
-            db_session.add(job)
-            service.assign_job_to_worker(worker_id, job.job_id)
+            for i in range(3)
+        ]
+        db_session.add_all(jobs)
         db_session.commit()
+        redis_client.sadd(f"worker:{worker_id}:jobs", *[str(job.job_id) for job in jobs])
 
         # Handle stale worker
         service.handle_stale_worker(worker_id)
@@ -1,6 +1,10 @@
 """Integration tests for Job dependencies (DAG support)."""
+import graphlib
 import pytest
+from sqlalchemy.orm import selectinload
 from schedora.core.enums import JobStatus
+from schedora.models.job import Job
+from schedora.services.dependency_resolver import DependencyResolver
 from tests.factories.job_factory import create_job
 
 
@@ -19,8 +23,7 @@ class TestJobDependencies:
         # Add dependencies
         charge_payment.dependencies.append(validate_order)
         charge_payment.dependencies.append(reserve_inventory)
-        db_session.commit()
-        db_session.refresh(charge_payment)
+        db_session.flush()
 
         assert len(charge_payment.dependencies) == 2
         assert validate_order in charge_payment.dependencies
@@ -37,8 +40,13 @@ class TestJobDependencies:
 
         reserve_inventory.dependencies.append(validate_order)
         charge_payment.dependencies.append(validate_order)
-        db_session.commit()
-        db_session.refresh(validate_order)
+        db_session.flush()
+        validate_order = db_session.get(
+            Job,
+            validate_order.job_id,
+            options=[selectinload(Job.dependents)],
+            populate_existing=True,
+        )
 
         assert len(validate_order.dependents) == 2
         assert reserve_inventory in validate_order.dependents
@@ -72,9 +80,19 @@ class TestJobDependencies:
         charge.dependencies.append(fraud)
         invoice.dependencies.append(charge)
 
-        db_session.commit()
-        db_session.refresh(validate)
-        db_session.refresh(charge)
+        db_session.flush()
+        validate = db_session.get(
+            Job,
+            validate.job_id,
+            options=[selectinload(Job.dependents)],
+            populate_existing=True,
+        )
+        charge = db_session.get(
+            Job,
+            charge.job_id,
+            options=[selectinload(Job.dependencies), selectinload(Job.dependents)],
+            populate_existing=True,
+        )
 
         # Validate structure
         assert len(validate.dependents) == 2
@@ -91,9 +109,26 @@ class TestJobDependencies:
         job_a.dependencies.append(job_b)
         job_b.dependencies.append(job_a)  # Circular!
 
-        db_session.commit()
+        db_session.flush()
 
-        # For now, this is allowed at DB level
-        # In Phase 2, we'll add validation logic to prevent this
+        # Allowed at DB level, rejected by the resolver's DAG validation
         assert job_a in job_b.dependents
         assert job_b in job_a.dependents
+
+        resolver = DependencyResolver(db_session)
+        with pytest.raises(graphlib.CycleError):
+            resolver.validate_acyclic([job_a, job_b])
+
+    def test_acyclic_dependencies_validate(self, db_session):
+        """Test a valid DAG passes cycle validation."""
+        validate = create_job(db_session, job_type="validate_order", idempotency_key="acyc-1")
+        reserve = create_job(db_session, job_type="reserve_inventory", idempotency_key="acyc-2")
+        charge = create_job(db_session, job_type="charge_payment", idempotency_key="acyc-3")
+
+        reserve.dependencies.append(validate)
+        charge.dependencies.append(validate)
+        charge.dependencies.append(reserve)
+        db_session.flush()
+
+        resolver = DependencyResolver(db_session)
+        resolver.validate_acyclic([validate, reserve, charge])
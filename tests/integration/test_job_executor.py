@@ -2,8 +2,37 @@
 import pytest
 import asyncio
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import uuid4
+from sqlalchemy import select
 from schedora.core.enums import JobStatus
+from schedora.models.job import Job
+from schedora.services.job_service import JobService
+from schedora.worker.database_adapter import DatabaseAdapter
+from schedora.worker.handler_registry import HandlerRegistry
+from schedora.worker.job_executor import JobExecutor
+from tests.factories.job_factory import unique_key
+
+pytestmark = pytest.mark.usefixtures("no_expire_on_commit")
+
+
+@pytest.fixture
+def executor_factory(db_session, handler_registry):
+    """
+    Provide a builder for test-session JobExecutors bound to db_session.
+
+    The builder uses the shared handler registry unless a registry is
+    passed in, and returns a fully wired executor.
+    """
+
+    def build(registry: Optional[HandlerRegistry] = None) -> JobExecutor:
+        if registry is None:
+            registry = handler_registry
+        job_service = JobService(db_session)
+        adapter = DatabaseAdapter(job_service=job_service)
+        return JobExecutor(registry, adapter, job_service, use_test_session=True)
+
+    return build
 
 
 @pytest.mark.integration
@@ -11,172 +40,112 @@ from schedora.core.enums import JobStatus
 class TestJobExecutor:
     """Integration tests for JobExecutor."""
 
-    async def test_execute_job_successfully(self, db_session):
+    async def test_execute_job_successfully(self, db_session, executor_factory):
         """Test successful job execution (RUNNING → SUCCESS)."""
-        from schedora.worker.job_executor import JobExecutor
-        from schedora.worker.handler_registry import HandlerRegistry
-        from schedora.worker.handlers.echo_handler import echo_handler
-        from schedora.worker.database_adapter import DatabaseAdapter
-        from schedora.services.job_service import JobService
-        from schedora.models.job import Job
-
         # Create test job
         job = Job(
             job_id=uuid4(),
             type="echo",
             payload={"message": "test"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.RUNNING,
         )
         db_session.add(job)
-        db_session.commit()
-
-        # Setup handler registry
-        registry = HandlerRegistry()
-        registry.register_handler("echo", echo_handler)
-
-        # Setup services
-        job_service = JobService(db_session)
-        adapter = DatabaseAdapter(job_service=job_service)
+        db_session.flush()
 
         # Execute job
-        executor = JobExecutor(registry, adapter, job_service, use_test_session=True)
+        executor = executor_factory()
         result = await executor.execute(job)
 
         assert result.success is True
         assert result.result == {"message": "test"}
 
         # Verify job updated
-        db_session.refresh(job)
         assert job.status == JobStatus.SUCCESS
         assert job.result == {"message": "test"}
         assert job.completed_at is not None
 
-    async def test_execute_job_with_timeout(self, db_session):
+    async def test_execute_job_with_timeout(self, db_session, executor_factory, monkeypatch):
         """Test job execution timeout."""
-        from schedora.worker.job_executor import JobExecutor
-        from schedora.worker.handler_registry import HandlerRegistry
-        from schedora.worker.handlers.sleep_handler import sleep_handler
-        from schedora.worker.database_adapter import DatabaseAdapter
-        from schedora.services.job_service import JobService
-        from schedora.models.job import Job
+        # Run the timeout on a 1000x faster clock: 1 logical second = 1 ms
+        run_with_timeout = JobExecutor._run_handler_with_timeout
+
+        async def fast_clock_timeout(self, handler, payload, timeout_seconds):
+            return await run_with_timeout(self, handler, payload, timeout_seconds / 1000)
+
+        monkeypatch.setattr(JobExecutor, "_run_handler_with_timeout", fast_clock_timeout)
 
         # Create test job with short timeout
         job = Job(
             job_id=uuid4(),
             type="sleep",
             payload={"duration": 10},  # Sleep for 10 seconds
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.RUNNING,
             timeout_seconds=1,  # But timeout after 1 second
         )
         db_session.add(job)
-        db_session.commit()
-
-        # Setup handler registry
-        registry = HandlerRegistry()
-        registry.register_handler("sleep", sleep_handler)
-
-        # Setup services
-        job_service = JobService(db_session)
-        adapter = DatabaseAdapter(job_service=job_service)
+        db_session.flush()
 
         # Execute job (should timeout)
-        executor = JobExecutor(registry, adapter, job_service, use_test_session=True)
+        executor = executor_factory()
         result = await executor.execute(job)
 
         assert result.success is False
         assert "timeout" in result.error_message.lower() or "timed out" in result.error_message.lower()
 
-    async def test_execute_job_with_handler_exception(self, db_session):
+    async def test_execute_job_with_handler_exception(self, db_session, executor_factory):
         """Test job execution with handler exception (RUNNING → FAILED)."""
-        from schedora.worker.job_executor import JobExecutor
-        from schedora.worker.handler_registry import HandlerRegistry
-        from schedora.worker.handlers.fail_handler import fail_handler
-        from schedora.worker.database_adapter import DatabaseAdapter
-        from schedora.services.job_service import JobService
-        from schedora.models.job import Job
-
         # Create test job
         job = Job(
             job_id=uuid4(),
             type="fail",
             payload={"error_message": "Test error"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.RUNNING,
             max_retries=0,  # No retries
         )
         db_session.add(job)
-        db_session.commit()
-
-        # Setup handler registry
-        registry = HandlerRegistry()
-        registry.register_handler("fail", fail_handler)
-
-        # Setup services
-        job_service = JobService(db_session)
-        adapter = DatabaseAdapter(job_service=job_service)
+        db_session.flush()
 
         # Execute job (should fail)
-        executor = JobExecutor(registry, adapter, job_service, use_test_session=True)
+        executor = executor_factory()
         result = await executor.execute(job)
 
         assert result.success is False
         assert "Test error" in result.error_message
 
         # Verify job marked as failed
-        db_session.refresh(job)
         assert job.status == JobStatus.FAILED
         assert job.error_message is not None
 
-    async def test_execute_job_updates_timestamps(self, db_session):
+    async def test_execute_job_updates_timestamps(self, db_session, executor_factory):
         """Test job execution updates started_at and completed_at."""
-        from schedora.worker.job_executor import JobExecutor
-        from schedora.worker.handler_registry import HandlerRegistry
-        from schedora.worker.handlers.echo_handler import echo_handler
-        from schedora.worker.database_adapter import DatabaseAdapter
-        from schedora.services.job_service import JobService
-        from schedora.models.job import Job
-
         # Create test job
         job = Job(
             job_id=uuid4(),
             type="echo",
             payload={"test": "data"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.RUNNING,
         )
         db_session.add(job)
-        db_session.commit()
+        db_session.flush()
 
         assert job.started_at is None
         assert job.completed_at is None
 
-        # Setup handler registry
-        registry = HandlerRegistry()
-        registry.register_handler("echo", echo_handler)
-
-        # Setup services
-        job_service = JobService(db_session)
-        adapter = DatabaseAdapter(job_service=job_service)
-
         # Execute job
-        executor = JobExecutor(registry, adapter, job_service, use_test_session=True)
+        executor = executor_factory()
         await executor.execute(job)
 
         # Verify timestamps updated
-        db_session.refresh(job)
         assert job.started_at is not None
         assert job.completed_at is not None
         assert job.completed_at >= job.started_at
 
-    async def test_execute_saves_result_to_database(self, db_session):
+    async def test_execute_saves_result_to_database(self, db_session, executor_factory):
         """Test job execution saves result to database."""
-        from schedora.worker.job_executor import JobExecutor
-        from schedora.worker.handler_registry import HandlerRegistry
-        from schedora.worker.database_adapter import DatabaseAdapter
-        from schedora.services.job_service import JobService
-        from schedora.models.job import Job
 
         async def custom_handler(payload):
             return {"computed": payload["value"] * 2, "status": "ok"}
@@ -186,56 +155,37 @@ class TestJobExecutor:
             job_id=uuid4(),
             type="custom",
             payload={"value": 21},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.RUNNING,
         )
         db_session.add(job)
-        db_session.commit()
+        db_session.flush()
 
-        # Setup handler registry
+        # Execute job
         registry = HandlerRegistry()
         registry.register_handler("custom", custom_handler)
-
-        # Setup services
-        job_service = JobService(db_session)
-        adapter = DatabaseAdapter(job_service=job_service)
-
-        # Execute job
-        executor = JobExecutor(registry, adapter, job_service, use_test_session=True)
+        executor = executor_factory(registry)
         await executor.execute(job)
 
-        # Verify result saved
-        db_session.refresh(job)
-        assert job.result == {"computed": 42, "status": "ok"}
+        # Verify result saved; read it back rather than from the identity map
+        saved = db_session.scalar(select(Job.result).where(Job.job_id == job.job_id))
+        assert saved == {"computed": 42, "status": "ok"}
 
-    async def test_execute_handler_not_found(self, db_session):
+    async def test_execute_handler_not_found(self, db_session, executor_factory):
         """Test execution fails when handler not found."""
-        from schedora.worker.job_executor import JobExecutor
-        from schedora.worker.handler_registry import HandlerRegistry
-        from schedora.worker.database_adapter import DatabaseAdapter
-        from schedora.services.job_service import JobService
-        from schedora.models.job import Job
-
         # Create test job with unregistered type
         job = Job(
             job_id=uuid4(),
             type="nonexistent",
             payload={},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.RUNNING,
         )
         db_session.add(job)
-        db_session.commit()
-
-        # Empty registry
-        registry = HandlerRegistry()
-
-        # Setup services
-        job_service = JobService(db_session)
-        adapter = DatabaseAdapter(job_service=job_service)
+        db_session.flush()
 
-        # Execute job (should fail with handler not found)
-        executor = JobExecutor(registry, adapter, job_service, use_test_session=True)
+        # Execute job with an empty registry (should fail with handler not found)
+        executor = executor_factory(HandlerRegistry())
         result = await executor.execute(job)
 
         assert result.success is False
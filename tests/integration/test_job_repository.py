@@ -1,11 +1,14 @@
 """Integration tests for Job repository."""
 import pytest
 from uuid import uuid4
+from sqlalchemy import event
 from schedora.repositories.job_repository import JobRepository
 from schedora.core.enums import JobStatus
 from schedora.core.exceptions import JobNotFoundError
 from tests.factories.job_factory import create_job
 
+pytestmark = pytest.mark.sqlite
+
 
 class TestJobRepository:
     """Test Job repository data access layer."""
@@ -38,6 +41,25 @@ class TestJobRepository:
         assert retrieved_job.job_id == created_job.job_id
         assert retrieved_job.type == "retrieve_test"
 
+    def test_get_by_id_uses_identity_map(self, db_session):
+        """Test loaded jobs are returned from the session without a SELECT."""
+        repo = JobRepository(db_session)
+        created_job = create_job(db_session, job_type="cached_test")
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        bind = db_session.connection()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            retrieved_job = repo.get_by_id(created_job.job_id)
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+        assert retrieved_job is created_job
+        assert statements == []
+
     def test_get_by_id_not_found(self, db_session):
         """Test repository returns None for non-existent job."""
         repo = JobRepository(db_session)
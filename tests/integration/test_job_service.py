@@ -1,6 +1,8 @@
 """Integration tests for Job service."""
 import pytest
+from unittest.mock import Mock, patch
 from uuid import uuid4
+from sqlalchemy import event
 from schedora.services.job_service import JobService
 from schedora.api.schemas.job import JobCreate
 from schedora.core.enums import JobStatus
@@ -39,7 +41,63 @@ class TestJobService:
 
         with pytest.raises(DuplicateIdempotencyKeyError) as exc_info:
             service.create_job(job_data)
-        assert "duplicate-key" in str(exc_info.value).lower()
+        assert exc_info.value.idempotency_key == "duplicate-key"
+
+    def test_create_jobs_bulk_rejects_existing_key(self, db_session):
+        """Test bulk creation fails if any idempotency key already exists."""
+        service = JobService(db_session)
+        service.create_job(JobCreate(type="test", idempotency_key="bulk-existing"))
+
+        with pytest.raises(DuplicateIdempotencyKeyError) as exc_info:
+            service.create_jobs_bulk([
+                JobCreate(type="test", idempotency_key="bulk-new"),
+                JobCreate(type="test", idempotency_key="bulk-existing"),
+            ])
+        assert exc_info.value.idempotency_key == "bulk-existing"
+
+    def test_create_jobs_bulk_concurrent_duplicate_raises(self, db_session):
+        """Test a key inserted after the pre-check surfaces as a duplicate error."""
+        service = JobService(db_session)
+        service.create_job(JobCreate(type="test", idempotency_key="bulk-race"))
+
+        # The first check misses the key, as if it was inserted concurrently
+        with patch.object(
+            service.repository,
+            "get_existing_idempotency_keys",
+            side_effect=[set(), {"bulk-race"}],
+        ):
+            with pytest.raises(DuplicateIdempotencyKeyError) as exc_info:
+                service.create_jobs_bulk([
+                    JobCreate(type="test", idempotency_key="bulk-race-new"),
+                    JobCreate(type="test", idempotency_key="bulk-race"),
+                ])
+        assert exc_info.value.idempotency_key == "bulk-race"
+
+    def test_create_jobs_bulk_enqueues_without_reloading(self, db_session):
+        """Test enqueueing a bulk batch does not reload each job after the commit."""
+        queue = Mock()
+        service = JobService(db_session, queue=queue)
+        selects = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        bind = db_session.connection()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            jobs = service.create_jobs_bulk([
+                JobCreate(type="test", idempotency_key=f"bulk-noreload-{i}", priority=i)
+                for i in range(3)
+            ])
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+        # Only the idempotency key pre-check reads from the database
+        assert len(selects) == 1
+        queue.enqueue_many.assert_called_once_with(
+            [(job.job_id, job.priority) for job in jobs]
+        )
 
     def test_get_job_success(self, db_session):
         """Test getting existing job."""
@@ -1,10 +1,10 @@
 """Integration tests for Job Service with Redis queue."""
 import pytest
-from uuid import uuid4
 from schedora.services.job_service import JobService
 from schedora.services.redis_queue import RedisQueue
 from schedora.api.schemas.job import JobCreate
 from schedora.core.enums import JobStatus
+from tests.factories.job_factory import unique_key
 
 
 @pytest.mark.integration
@@ -14,14 +14,13 @@ class TestJobServiceWithQueue:
     def test_create_pending_job_enqueues_to_redis(self, db_session, redis_client):
         """Test creating PENDING job automatically enqueues to Redis."""
         queue = RedisQueue(redis_client, queue_name="test_create_pending")
-        queue.purge()
 
         job_service = JobService(db_session, queue=queue)
 
         job_data = JobCreate(
             type="echo",
             payload={"message": "test"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             # No scheduled_at means immediate execution (PENDING status)
         )
 
@@ -34,7 +33,6 @@ class TestJobServiceWithQueue:
     def test_create_job_with_priority(self, db_session, redis_client):
         """Test creating job with priority enqueues correctly."""
         queue = RedisQueue(redis_client, queue_name="test_priority")
-        queue.purge()
 
         job_service = JobService(db_session, queue=queue)
 
@@ -42,7 +40,7 @@ class TestJobServiceWithQueue:
         job1_data = JobCreate(
             type="echo",
             payload={"message": "low"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             priority=1,
         )
         job1 = job_service.create_job(job1_data)
@@ -51,7 +49,7 @@ class TestJobServiceWithQueue:
         job2_data = JobCreate(
             type="echo",
             payload={"message": "high"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             priority=10,
         )
         job2 = job_service.create_job(job2_data)
@@ -65,14 +63,13 @@ class TestJobServiceWithQueue:
         from datetime import datetime, timezone, timedelta
 
         queue = RedisQueue(redis_client, queue_name="test_scheduled")
-        queue.purge()
 
         job_service = JobService(db_session, queue=queue)
 
         job_data = JobCreate(
             type="echo",
             payload={"message": "scheduled"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             scheduled_at=datetime.now(timezone.utc) + timedelta(hours=1),
         )
 
@@ -87,14 +84,13 @@ class TestJobServiceWithQueue:
     def test_cancel_job_removes_from_queue(self, db_session, redis_client):
         """Test canceling job removes it from Redis queue."""
         queue = RedisQueue(redis_client, queue_name="test_cancel")
-        queue.purge()
 
         job_service = JobService(db_session, queue=queue)
 
         job_data = JobCreate(
             type="echo",
             payload={"message": "test"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
         )
 
         job = job_service.create_job(job_data)
@@ -110,27 +106,22 @@ class TestJobServiceWithQueue:
     def test_create_multiple_jobs_all_enqueued(self, db_session, redis_client):
         """Test creating multiple jobs enqueues all of them."""
         queue = RedisQueue(redis_client, queue_name="test_multiple")
-        queue.purge()
 
         job_service = JobService(db_session, queue=queue)
 
-        job_ids = []
-        for i in range(5):
-            job_data = JobCreate(
+        jobs = job_service.create_jobs_bulk([
+            JobCreate(
                 type="echo",
                 payload={"index": i},
-                idempotency_key=f"test-{uuid4()}",
+                idempotency_key=unique_key("test"),
                 priority=i,
             )
-            job = job_service.create_job(job_data)
-            job_ids.append(job.job_id)
+            for i in range(5)
+        ])
+        job_ids = [job.job_id for job in jobs]
 
-        # All 5 jobs should be in queue
-        assert queue.get_queue_length() == 5
-
-        # Should dequeue in priority order (highest first)
-        assert queue.dequeue() == job_ids[4]  # priority 4
-        assert queue.dequeue() == job_ids[3]  # priority 3
+        # All 5 jobs should be queued in priority order (highest first)
+        assert queue.peek_many(5) == job_ids[::-1]
 
     def test_create_job_without_queue_still_works(self, db_session):
         """Test JobService works without queue (backward compatibility)."""
@@ -139,7 +130,7 @@ class TestJobServiceWithQueue:
         job_data = JobCreate(
             type="echo",
             payload={"message": "test"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
         )
 
         # Should not raise error
@@ -151,11 +142,10 @@ class TestJobServiceWithQueue:
         from schedora.core.exceptions import DuplicateIdempotencyKeyError
 
         queue = RedisQueue(redis_client, queue_name="test_duplicate")
-        queue.purge()
 
         job_service = JobService(db_session, queue=queue)
 
-        idempotency_key = f"test-{uuid4()}"
+        idempotency_key = unique_key("test")
         job_data = JobCreate(
             type="echo",
             payload={"message": "test"},
@@ -178,7 +168,6 @@ class TestJobServiceWithQueue:
         from datetime import datetime, timezone, timedelta
 
         queue = RedisQueue(redis_client, queue_name="test_transition")
-        queue.purge()
 
         job_service = JobService(db_session, queue=queue)
 
@@ -186,7 +175,7 @@ class TestJobServiceWithQueue:
         job_data = JobCreate(
             type="echo",
             payload={"message": "test"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             scheduled_at=datetime.now(timezone.utc) + timedelta(hours=1),
         )
 
@@ -1,207 +1,99 @@
 """Integration tests for production mode execution paths."""
 import pytest
 import asyncio
-from uuid import uuid4
+from uuid import UUID
+from sqlalchemy import insert, select
 from datetime import datetime, timezone
 from schedora.core.enums import JobStatus
 from schedora.models.job import Job
 from schedora.worker.job_executor import JobExecutor
-from schedora.worker.handler_registry import HandlerRegistry
-from schedora.worker.handlers.echo_handler import echo_handler
-from schedora.worker.handlers.fail_handler import fail_handler
 from schedora.services.job_service import JobService
 from schedora.core.database import SessionLocal
 from schedora.worker.database_adapter import DatabaseAdapter
+from tests.factories.job_factory import unique_key
+from tests.integration.helpers import wait_for_status
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-class TestJobExecutorProductionMode:
-    """Test JobExecutor in production mode (use_test_session=False)."""
+@pytest.fixture(scope="class")
+def shared_session(test_engine):
+    """One real (non-transactional) session shared by a test class."""
+    session = SessionLocal()
+    yield session
+    session.close()
 
-    async def test_executor_production_mode_success(self, test_engine):
-        """Test job execution in production mode with fresh sessions."""
-        # Create job in database
-        session = SessionLocal()
-        try:
-            job = Job(
-                job_id=uuid4(),
-                type="echo",
-                payload={"message": "production test"},
-                idempotency_key=f"prod-test-{uuid4()}",
-                status=JobStatus.SCHEDULED,
-            )
-            session.add(job)
-            session.commit()
-            job_id = job.job_id
-        finally:
-            session.close()
 
-        # Setup executor in production mode
-        session2 = SessionLocal()
-        try:
-            registry = HandlerRegistry()
-            registry.register_handler("echo", echo_handler)
-            job_service = JobService(session2)
-            adapter = DatabaseAdapter(job_service=job_service)
-
-            executor = JobExecutor(
-                handler_registry=registry,
-                database_adapter=adapter,
-                job_service=job_service,
-                use_test_session=False  # Production mode
-            )
+def seed_job(session, **values) -> UUID:
+    """Insert a job row with a Core INSERT ... RETURNING and commit it."""
+    job_id = session.execute(
+        insert(Job).values(**values).returning(Job.job_id)
+    ).scalar_one()
+    session.commit()
+    return job_id
 
-            # Get job and execute
-            job = job_service.get_job(job_id)
-            await executor.execute(job)
-
-            # Verify in new session
-            session3 = SessionLocal()
-            try:
-                completed_job = session3.query(Job).filter(Job.job_id == job_id).first()
-                assert completed_job.status == JobStatus.SUCCESS
-                assert completed_job.result == {"message": "production test"}
-                assert completed_job.started_at is not None
-                assert completed_job.completed_at is not None
-            finally:
-                session3.close()
-        finally:
-            session2.close()
 
-    async def test_executor_production_mode_failure(self, test_engine):
-        """Test job failure in production mode saves error correctly."""
-        # Create job that will fail
-        session = SessionLocal()
-        try:
-            job = Job(
-                job_id=uuid4(),
-                type="fail",
-                payload={"error_message": "Test failure"},
-                idempotency_key=f"prod-fail-{uuid4()}",
-                status=JobStatus.SCHEDULED,
-                max_retries=0,  # No retries
-            )
-            session.add(job)
-            session.commit()
-            job_id = job.job_id
-        finally:
-            session.close()
+@pytest.fixture
+def production_executor(test_engine, handler_registry):
+    """JobExecutor in production mode, backed by its own real session."""
+    session = SessionLocal()
+    job_service = JobService(session)
+    yield JobExecutor(
+        handler_registry=handler_registry,
+        database_adapter=DatabaseAdapter(job_service=job_service),
+        job_service=job_service,
+        use_test_session=False,  # Production mode
+    )
+    session.close()
 
-        # Setup executor
-        session2 = SessionLocal()
-        try:
-            registry = HandlerRegistry()
-            registry.register_handler("fail", fail_handler)
-            job_service = JobService(session2)
-            adapter = DatabaseAdapter(job_service=job_service)
-
-            executor = JobExecutor(
-                handler_registry=registry,
-                database_adapter=adapter,
-                job_service=job_service,
-                use_test_session=False
-            )
-
-            # Execute failing job
-            job = job_service.get_job(job_id)
-            await executor.execute(job)
-
-            # Verify error saved
-            session3 = SessionLocal()
-            try:
-                failed_job = session3.query(Job).filter(Job.job_id == job_id).first()
-                assert failed_job.status == JobStatus.FAILED
-                assert failed_job.error_message is not None
-                assert "Test failure" in failed_job.error_message
-            finally:
-                session3.close()
-        finally:
-            session2.close()
-
-    async def test_executor_production_update_timestamps(self, test_engine):
-        """Test timestamps are updated correctly in production mode."""
-        # Create job
-        session = SessionLocal()
-        try:
-            job = Job(
-                job_id=uuid4(),
-                type="echo",
-                payload={"test": "timestamps"},
-                idempotency_key=f"prod-time-{uuid4()}",
-                status=JobStatus.SCHEDULED,
-            )
-            session.add(job)
-            session.commit()
-            job_id = job.job_id
-        finally:
-            session.close()
 
-        # Execute
-        session2 = SessionLocal()
-        try:
-            registry = HandlerRegistry()
-            registry.register_handler("echo", echo_handler)
-            job_service = JobService(session2)
-            adapter = DatabaseAdapter(job_service=job_service)
-            executor = JobExecutor(registry, adapter, job_service, use_test_session=False)
-
-            job = job_service.get_job(job_id)
-            await executor.execute(job)
-
-            # Check timestamps
-            session3 = SessionLocal()
-            try:
-                completed = session3.query(Job).filter(Job.job_id == job_id).first()
-                assert completed.started_at is not None
-                assert completed.completed_at is not None
-                assert completed.started_at < completed.completed_at
-            finally:
-                session3.close()
-        finally:
-            session2.close()
-
-    async def test_executor_production_transition_status(self, test_engine):
-        """Test status transitions work in production mode."""
-        # Create job in SCHEDULED state
-        session = SessionLocal()
-        try:
-            job = Job(
-                job_id=uuid4(),
-                type="echo",
-                payload={"test": "status"},
-                idempotency_key=f"prod-status-{uuid4()}",
-                status=JobStatus.SCHEDULED,
-            )
-            session.add(job)
-            session.commit()
-            job_id = job.job_id
-        finally:
-            session.close()
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestJobExecutorProductionMode:
+    """Test JobExecutor in production mode (use_test_session=False)."""
 
-        # Execute
-        session2 = SessionLocal()
-        try:
-            registry = HandlerRegistry()
-            registry.register_handler("echo", echo_handler)
-            job_service = JobService(session2)
-            adapter = DatabaseAdapter(job_service=job_service)
-            executor = JobExecutor(registry, adapter, job_service, use_test_session=False)
-
-            job = job_service.get_job(job_id)
-
-            # Should transition SCHEDULED -> RUNNING -> SUCCESS
-            await executor.execute(job)
-
-            # Verify final status
-            session3 = SessionLocal()
-            try:
-                final_job = session3.query(Job).filter(Job.job_id == job_id).first()
-                assert final_job.status == JobStatus.SUCCESS
-            finally:
-                session3.close()
-        finally:
-            session2.close()
+    @pytest.mark.parametrize(
+        "job_type, payload, expected_status",
+        [
+            ("echo", {"message": "production test"}, JobStatus.SUCCESS),
+            ("fail", {"error_message": "Test failure"}, JobStatus.FAILED),
+        ],
+        ids=["success", "failure"],
+    )
+    async def test_executor_production_mode(
+        self, shared_session, production_executor, job_type, payload, expected_status
+    ):
+        """Test execution persists status, result/error and timestamps in production mode."""
+        job_id = seed_job(
+            shared_session,
+            type=job_type,
+            payload=payload,
+            idempotency_key=unique_key(f"prod-{job_type}"),
+            status=JobStatus.SCHEDULED,
+            max_retries=0,  # No retries
+        )
+
+        # Should transition SCHEDULED -> RUNNING -> SUCCESS/FAILED
+        job = production_executor.job_service.get_job(job_id)
+        await production_executor.execute(job)
+
+        # Read back only the checked columns, without building a Job
+        final_job = shared_session.execute(
+            select(
+                Job.status,
+                Job.result,
+                Job.error_message,
+                Job.started_at,
+                Job.completed_at,
+            ).where(Job.job_id == job_id)
+        ).one()
+        assert final_job.status == expected_status
+        if expected_status == JobStatus.SUCCESS:
+            assert final_job.result == payload
+            assert final_job.started_at is not None
+            assert final_job.completed_at is not None
+            assert final_job.started_at < final_job.completed_at
+        else:
+            assert final_job.error_message is not None
+            assert "Test failure" in final_job.error_message
 
 
 @pytest.mark.integration
@@ -209,36 +101,26 @@ class TestJobExecutorProductionMode:
 class TestAsyncWorkerProductionMode:
     """Test AsyncWorker production mode paths."""
 
-    async def test_worker_production_mode_job_execution(self, test_engine):
+    async def test_worker_production_mode_job_execution(self, shared_session, handler_registry):
         """Test worker executes job in production mode."""
         from schedora.worker.async_worker import AsyncWorker
 
         # Create job
-        session = SessionLocal()
-        try:
-            job = Job(
-                job_id=uuid4(),
-                type="echo",
-                payload={"msg": "worker prod test"},
-                idempotency_key=f"worker-prod-{uuid4()}",
-                status=JobStatus.PENDING,
-            )
-            session.add(job)
-            session.commit()
-            job_id = job.job_id
-        finally:
-            session.close()
+        job_id = seed_job(
+            shared_session,
+            type="echo",
+            payload={"msg": "worker prod test"},
+            idempotency_key=unique_key("worker-prod"),
+            status=JobStatus.PENDING,
+        )
 
         # Run worker in production mode
         session2 = SessionLocal()
         try:
-            registry = HandlerRegistry()
-            registry.register_handler("echo", echo_handler)
-
             worker = AsyncWorker(
                 worker_id="prod-worker",
                 db_session=session2,
-                handler_registry=registry,
+                handler_registry=handler_registry,
                 max_concurrent_jobs=5,
                 poll_interval=0.1,
                 use_test_session=False  # Production mode
@@ -246,50 +128,84 @@ class TestAsyncWorkerProductionMode:
 
             # Start worker briefly
             worker_task = asyncio.create_task(worker.start())
-            await asyncio.sleep(0.5)
+            await wait_for_status(shared_session, job_id, JobStatus.SUCCESS)
             await worker.stop()
             await worker_task
 
             # Verify job completed
-            session3 = SessionLocal()
-            try:
-                completed = session3.query(Job).filter(Job.job_id == job_id).first()
-                assert completed.status == JobStatus.SUCCESS
-            finally:
-                session3.close()
+            status = shared_session.execute(
+                select(Job.status).where(Job.job_id == job_id)
+            ).scalar_one()
+            assert status == JobStatus.SUCCESS
         finally:
             session2.close()
 
-    async def test_worker_production_stop_with_running_tasks(self, test_engine):
-        """Test worker stop with timeout in production mode."""
+    async def test_worker_production_claims_batch(self, shared_session, handler_registry):
+        """Test a DB-polling worker fills its free slots with one batched claim."""
         from schedora.worker.async_worker import AsyncWorker
-        from schedora.worker.handlers.sleep_handler import sleep_handler
 
-        # Create long-running job
-        session = SessionLocal()
-        try:
-            job = Job(
-                job_id=uuid4(),
-                type="sleep",
-                payload={"duration": 5},  # Long job
-                idempotency_key=f"worker-stop-{uuid4()}",
+        # Top priority, and exactly as many jobs as free slots, so rows left
+        # by other tests in the shared database cannot take their place
+        job_ids = {
+            seed_job(
+                shared_session,
+                type="echo",
+                payload={"index": i},
+                idempotency_key=unique_key("worker-batch"),
                 status=JobStatus.PENDING,
+                priority=10,
             )
-            session.add(job)
-            session.commit()
+            for i in range(3)
+        }
+
+        session2 = SessionLocal()
+        try:
+            worker = AsyncWorker(
+                worker_id="batch-worker",
+                db_session=session2,
+                handler_registry=handler_registry,
+                max_concurrent_jobs=len(job_ids),
+                use_test_session=False
+            )
+
+            claimed = await worker._claim_jobs()
+
+            assert {job.job_id for job in claimed} == job_ids
+            rows = shared_session.execute(
+                select(Job.status, Job.worker_id).where(Job.job_id.in_(job_ids))
+            ).all()
+            assert rows == [(JobStatus.SCHEDULED, "batch-worker")] * len(job_ids)
         finally:
-            session.close()
+            session2.close()
+
+    async def test_worker_production_stop_with_running_tasks(self, shared_session, handler_registry):
+        """Test worker stop with timeout in production mode."""
+        from schedora.worker.async_worker import AsyncWorker
+
+        job_started = asyncio.Event()
+
+        async def instrumented_sleep_handler(payload):
+            job_started.set()
+            await asyncio.sleep(payload["duration"])
+
+        handler_registry.register_handler("instrumented_sleep", instrumented_sleep_handler)
+
+        # Create long-running job
+        seed_job(
+            shared_session,
+            type="instrumented_sleep",
+            payload={"duration": 5},  # Long job
+            idempotency_key=unique_key("worker-stop"),
+            status=JobStatus.PENDING,
+        )
 
         # Run worker
         session2 = SessionLocal()
         try:
-            registry = HandlerRegistry()
-            registry.register_handler("sleep", sleep_handler)
-
             worker = AsyncWorker(
                 worker_id="stop-test-worker",
                 db_session=session2,
-                handler_registry=registry,
+                handler_registry=handler_registry,
                 max_concurrent_jobs=5,
                 poll_interval=0.1,
                 use_test_session=False
@@ -297,7 +213,7 @@ class TestAsyncWorkerProductionMode:
 
             # Start and quickly stop with timeout
             worker_task = asyncio.create_task(worker.start())
-            await asyncio.sleep(0.3)  # Let job start
+            await asyncio.wait_for(job_started.wait(), timeout=2.0)  # Let job start
             await worker.stop(timeout=0.2)  # Short timeout
             await worker_task
 
@@ -306,26 +222,35 @@ class TestAsyncWorkerProductionMode:
         finally:
             session2.close()
 
-    async def test_worker_production_handles_errors(self, test_engine, caplog):
+    async def test_worker_production_handles_errors(
+        self, shared_session, handler_registry, caplog
+    ):
         """Test worker handles errors in production mode poll loop."""
         from schedora.worker.async_worker import AsyncWorker
-        from unittest.mock import patch
+
+        job_id = seed_job(
+            shared_session,
+            type="fail",
+            payload={"error_message": "Test failure"},
+            idempotency_key=unique_key("worker-error"),
+            status=JobStatus.PENDING,
+            max_retries=0,
+        )
 
         session = SessionLocal()
         try:
-            registry = HandlerRegistry()
             worker = AsyncWorker(
                 worker_id="error-worker",
                 db_session=session,
-                handler_registry=registry,
+                handler_registry=handler_registry,
                 max_concurrent_jobs=5,
                 poll_interval=0.1,
                 use_test_session=False
             )
 
-            # Mock _claim_job to raise error once
+            # Mock _claim_jobs to raise error once
             call_count = 0
-            original_claim = worker._claim_job
+            original_claim = worker._claim_jobs
 
             async def mock_claim():
                 nonlocal call_count
@@ -334,11 +259,11 @@ class TestAsyncWorkerProductionMode:
                     raise Exception("Production mode error")
                 return await original_claim()
 
-            worker._claim_job = mock_claim
+            worker._claim_jobs = mock_claim
 
-            # Run briefly
+            # The worker recovers from the error and runs the seeded job
             worker_task = asyncio.create_task(worker.start())
-            await asyncio.sleep(0.3)
+            await wait_for_status(shared_session, job_id, JobStatus.FAILED)
             await worker.stop()
             await worker_task
 
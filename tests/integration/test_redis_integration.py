@@ -136,28 +136,27 @@ class TestAsyncRedisIntegration:
 
         redis = await get_async_redis()
 
-        # Set and get value
-        await redis.set('async_test_key', 'async_value')
-        value = await redis.get('async_test_key')
+        # Set, get and clean up in one round trip
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set('async_test_key', 'async_value')
+            pipe.get('async_test_key')
+            pipe.delete('async_test_key')
+            _, value, _ = await pipe.execute()
 
         assert value == 'async_value'
 
-        # Cleanup
-        await redis.delete('async_test_key')
-
     async def test_async_redis_ttl(self):
         """Test async TTL operations."""
         from schedora.core.redis import get_async_redis
 
         redis = await get_async_redis()
 
-        # Set key with TTL
-        await redis.setex('async_ttl_test', 10, 'value')
+        # Set key with TTL, read the TTL and clean up in one round trip
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.setex('async_ttl_test', 10, 'value')
+            pipe.ttl('async_ttl_test')
+            pipe.delete('async_ttl_test')
+            _, ttl, _ = await pipe.execute()
 
-        # Check TTL exists
-        ttl = await redis.ttl('async_ttl_test')
         assert ttl > 0
         assert ttl <= 10
-
-        # Cleanup
-        await redis.delete('async_ttl_test')
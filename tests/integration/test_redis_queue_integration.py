@@ -12,7 +12,6 @@ class TestRedisQueueIntegration:
     def test_enqueue_dequeue_flow(self, redis_client):
         """Test complete enqueue/dequeue flow."""
         queue = RedisQueue(redis_client, queue_name="test_enqueue_dequeue")
-        queue.purge()  # Clean start
 
         # Enqueue 3 jobs with different priorities
         job1 = uuid4()
@@ -50,8 +49,6 @@ class TestRedisQueueIntegration:
     def test_dead_letter_queue_flow(self, redis_client):
         """Test moving jobs to DLQ."""
         queue = RedisQueue(redis_client, queue_name="test_dlq_flow")
-        queue.purge()
-        queue.purge_dlq()
 
         job_id = uuid4()
         queue.enqueue(job_id, priority=5)
@@ -74,7 +71,6 @@ class TestRedisQueueIntegration:
 
         # Enqueue in one instance
         queue1 = RedisQueue(redis_client, queue_name=queue_name)
-        queue1.purge()
         queue1.enqueue(job_id, priority=10)
 
         # Dequeue in another instance (same queue name)
@@ -85,18 +81,16 @@ class TestRedisQueueIntegration:
     def test_peek_does_not_remove(self, redis_client):
         """Test peeking doesn't remove job from queue."""
         queue = RedisQueue(redis_client, queue_name="test_peek")
-        queue.purge()
 
         job1 = uuid4()
         job2 = uuid4()
 
-        queue.enqueue(job1, priority=5)
-        queue.enqueue(job2, priority=10)
+        queue.enqueue_many([(job1, 5), (job2, 10)])
 
         # Peek multiple times
         assert queue.peek() == job2
         assert queue.peek() == job2
-        assert queue.get_queue_length() == 2
+        assert queue.get_lengths() == (2, 0)
 
         # Dequeue removes it
         assert queue.dequeue() == job2
@@ -106,32 +100,26 @@ class TestRedisQueueIntegration:
     def test_remove_specific_job(self, redis_client):
         """Test removing specific job from queue."""
         queue = RedisQueue(redis_client, queue_name="test_remove")
-        queue.purge()
 
         job1 = uuid4()
         job2 = uuid4()
         job3 = uuid4()
 
-        queue.enqueue(job1, priority=1)
-        queue.enqueue(job2, priority=2)
-        queue.enqueue(job3, priority=3)
+        queue.enqueue_many([(job1, 1), (job2, 2), (job3, 3)])
 
         # Remove middle job
         assert queue.remove(job2) is True
         assert queue.get_queue_length() == 2
 
         # Verify job2 is gone
-        assert queue.dequeue() == job3
-        assert queue.dequeue() == job1
+        assert queue.dequeue_many(3) == [job3, job1]
 
     def test_purge_queue(self, redis_client):
         """Test purging all jobs from queue."""
         queue = RedisQueue(redis_client, queue_name="test_purge")
-        queue.purge()
 
         # Add multiple jobs
-        for i in range(10):
-            queue.enqueue(uuid4(), priority=i)
+        queue.enqueue_many([(uuid4(), i) for i in range(10)])
 
         assert queue.get_queue_length() == 10
 
@@ -144,16 +132,12 @@ class TestRedisQueueIntegration:
     def test_purge_dlq(self, redis_client):
         """Test purging dead letter queue."""
         queue = RedisQueue(redis_client, queue_name="test_purge_dlq")
-        queue.purge()
-        queue.purge_dlq()
 
         # Move multiple jobs to DLQ
-        for i in range(5):
-            job_id = uuid4()
-            queue.enqueue(job_id)
-            queue.move_to_dlq(job_id, f"Error {i}")
+        queue.move_many_to_dlq((uuid4(), f"Error {i}") for i in range(5))
 
         assert queue.get_dlq_length() == 5
+        assert queue.get_queue_length() == 0
 
         # Purge DLQ
         queue.purge_dlq()
@@ -163,49 +147,38 @@ class TestRedisQueueIntegration:
     def test_fifo_ordering_same_priority(self, redis_client):
         """Test FIFO ordering for jobs with same priority."""
         queue = RedisQueue(redis_client, queue_name="test_fifo")
-        queue.purge()
 
         jobs = [uuid4() for _ in range(5)]
 
         # Enqueue all with same priority
-        for job in jobs:
-            queue.enqueue(job, priority=5)
-
-        # Should dequeue in FIFO order (Redis sorted set behavior)
-        # Note: With same scores, Redis uses lexicographic ordering
-        # So we can't guarantee FIFO, but all jobs should be retrievable
-        dequeued = []
-        for _ in range(5):
-            dequeued.append(queue.dequeue())
-
-        # Verify all jobs were dequeued
-        assert set(dequeued) == set(jobs)
+        queue.enqueue_many((job, 5) for job in jobs)
+
+        # Same priority dequeues in enqueue order
+        dequeued = queue.dequeue_many(5)
+
+        assert dequeued == jobs
         assert queue.dequeue() is None
 
     def test_concurrent_enqueue_dequeue(self, redis_client):
         """Test concurrent operations don't cause issues."""
         queue = RedisQueue(redis_client, queue_name="test_concurrent")
-        queue.purge()
 
         # Enqueue many jobs
         jobs = [uuid4() for _ in range(20)]
-        for i, job in enumerate(jobs):
-            queue.enqueue(job, priority=i)
+        queue.enqueue_many((job, i) for i, job in enumerate(jobs))
 
         assert queue.get_queue_length() == 20
 
         # Dequeue half
-        dequeued = []
-        for _ in range(10):
-            dequeued.append(queue.dequeue())
+        dequeued = queue.dequeue_many(10)
 
         assert queue.get_queue_length() == 10
         assert len(dequeued) == 10
 
         # Enqueue more
         new_jobs = [uuid4() for _ in range(5)]
-        for i, job in enumerate(new_jobs):
-            queue.enqueue(job, priority=100 + i)  # Higher priority
+        # Higher priority
+        queue.enqueue_many((job, 100 + i) for i, job in enumerate(new_jobs))
 
         assert queue.get_queue_length() == 15
 
@@ -216,7 +189,6 @@ class TestRedisQueueIntegration:
     def test_empty_queue_operations(self, redis_client):
         """Test operations on empty queue."""
         queue = RedisQueue(redis_client, queue_name="test_empty")
-        queue.purge()
 
         # All operations should handle empty queue gracefully
         assert queue.get_queue_length() == 0
@@ -233,8 +205,6 @@ class TestRedisQueueIntegration:
         import json
 
         queue = RedisQueue(redis_client, queue_name="test_dlq_metadata")
-        queue.purge()
-        queue.purge_dlq()
 
         job_id = uuid4()
         queue.enqueue(job_id)
@@ -1,10 +1,11 @@
 """Integration tests for job scheduler with atomic claiming."""
 import pytest
 from datetime import datetime, timedelta, timezone
+from sqlalchemy import event
 from schedora.services.scheduler import Scheduler
 from schedora.services.dependency_resolver import DependencyResolver
 from schedora.core.enums import JobStatus
-from tests.factories.job_factory import create_job
+from tests.factories.job_factory import create_job, create_jobs
 
 
 class TestScheduler:
@@ -76,6 +77,47 @@ class TestScheduler:
         db_session.refresh(job)
         assert job.status == JobStatus.PENDING
 
+    def test_claim_job_skips_relationship_loads(self, db_session, no_expire_on_commit):
+        """Test claiming and reading the job is one statement without loading the DAG."""
+        # no_expire_on_commit mirrors the worker's claim session
+        scheduler = Scheduler(db_session)
+
+        dep = create_job(
+            db_session,
+            job_type="dependency",
+            status=JobStatus.SUCCESS,
+            idempotency_key="dep-noload-1"
+        )
+        job = create_job(
+            db_session,
+            job_type="dependent_job",
+            status=JobStatus.PENDING,
+            scheduled_at=datetime.now(timezone.utc),
+            idempotency_key="dependent-noload-1"
+        )
+        job.dependencies.append(dep)
+        db_session.commit()
+        db_session.expire_all()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "SAVEPOINT" not in statement:
+                statements.append(statement)
+
+        bind = db_session.connection()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            claimed = scheduler.claim_job()
+            # The attributes AsyncWorker loads before detaching a claimed job
+            _ = (claimed.job_id, claimed.type, claimed.payload, claimed.timeout_seconds,
+                 claimed.status, claimed.max_retries, claimed.retry_count)
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+        assert claimed.job_id == job.job_id
+        assert len(statements) == 1
+        assert statements[0].lstrip().upper().startswith("UPDATE")
+
     def test_claim_job_with_met_dependencies(self, db_session):
         """Test scheduler claims job when dependencies are met."""
         scheduler = Scheduler(db_session)
@@ -118,26 +160,17 @@ class TestScheduler:
         """Test claiming multiple jobs in batch."""
         scheduler = Scheduler(db_session)
 
-        job1 = create_job(
-            db_session,
-            job_type="batch1",
-            status=JobStatus.PENDING,
-            scheduled_at=datetime.now(timezone.utc),
-            idempotency_key="batch-1"
-        )
-        job2 = create_job(
+        create_jobs(
             db_session,
-            job_type="batch2",
-            status=JobStatus.PENDING,
-            scheduled_at=datetime.now(timezone.utc),
-            idempotency_key="batch-2"
-        )
-        job3 = create_job(
-            db_session,
-            job_type="batch3",
-            status=JobStatus.PENDING,
-            scheduled_at=datetime.now(timezone.utc),
-            idempotency_key="batch-3"
+            [
+                {
+                    "job_type": f"batch{i}",
+                    "status": JobStatus.PENDING,
+                    "scheduled_at": datetime.now(timezone.utc),
+                    "idempotency_key": f"batch-{i}",
+                }
+                for i in (1, 2, 3)
+            ],
         )
 
         claimed = scheduler.claim_ready_jobs(limit=2)
@@ -146,29 +179,55 @@ class TestScheduler:
         assert all(j.status == JobStatus.SCHEDULED for j in claimed)
         assert all(j.worker_id is not None for j in claimed)
 
-    def test_claim_jobs_skips_running(self, db_session):
-        """Test claiming skips jobs already running."""
+    def test_claim_ready_jobs_highest_priority_first(self, db_session):
+        """Test batch claiming takes the highest-priority jobs first."""
         scheduler = Scheduler(db_session)
 
-        job1 = create_job(
+        jobs = create_jobs(
             db_session,
-            job_type="running",
-            status=JobStatus.RUNNING,
-            scheduled_at=datetime.now(timezone.utc),
-            idempotency_key="running-1"
+            [
+                {
+                    "job_type": "batch-priority",
+                    "priority": priority,
+                    "status": JobStatus.PENDING,
+                    "scheduled_at": datetime.now(timezone.utc),
+                    "idempotency_key": f"batch-priority-{priority}",
+                }
+                for priority in (1, 9, 5)
+            ],
         )
-        job2 = create_job(
+
+        claimed = scheduler.claim_ready_jobs(limit=2)
+
+        assert [j.priority for j in claimed] == [9, 5]
+        assert jobs[0].status == JobStatus.PENDING
+
+    def test_claim_jobs_skips_running(self, db_session):
+        """Test claiming skips jobs already running."""
+        scheduler = Scheduler(db_session)
+
+        _running, pending = create_jobs(
             db_session,
-            job_type="pending",
-            status=JobStatus.PENDING,
-            scheduled_at=datetime.now(timezone.utc),
-            idempotency_key="pending-skip-1"
+            [
+                {
+                    "job_type": "running",
+                    "status": JobStatus.RUNNING,
+                    "scheduled_at": datetime.now(timezone.utc),
+                    "idempotency_key": "running-1",
+                },
+                {
+                    "job_type": "pending",
+                    "status": JobStatus.PENDING,
+                    "scheduled_at": datetime.now(timezone.utc),
+                    "idempotency_key": "pending-skip-1",
+                },
+            ],
         )
 
         claimed = scheduler.claim_job()
 
         assert claimed is not None
-        assert claimed.job_id == job2.job_id
+        assert claimed.job_id == pending.job_id
 
     def test_concurrent_claim_no_duplicates(self, db_session):
         """Test claimed job cannot be claimed again."""
@@ -7,6 +7,8 @@ from schedora.core.enums import WorkerStatus
 
 
 @pytest.mark.integration
+@pytest.mark.sqlite
+@pytest.mark.usefixtures("no_expire_on_commit")
 class TestWorkerModel:
     """Integration tests for Worker database model."""
 
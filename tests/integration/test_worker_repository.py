@@ -2,6 +2,8 @@
 import pytest
 from datetime import datetime, timedelta, timezone
 from schedora.core.enums import WorkerStatus
+from schedora.repositories.worker_repository import WorkerRepository
+from tests.factories.worker_factory import create_workers
 
 
 @pytest.mark.integration
@@ -10,8 +12,6 @@ class TestWorkerRepository:
 
     def test_create_worker(self, db_session):
         """Test creating a worker."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
         repo = WorkerRepository(db_session)
 
         worker = repo.create(
@@ -28,9 +28,7 @@ class TestWorkerRepository:
         assert worker.status == WorkerStatus.STARTING
 
     def test_get_by_id(self, db_session):
-        """Test getting worker by ID."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
+        """Test getting worker by ID, and None for an unknown ID."""
         repo = WorkerRepository(db_session)
 
         # Create worker
@@ -48,20 +46,10 @@ class TestWorkerRepository:
         assert worker.worker_id == created.worker_id
         assert worker.hostname == created.hostname
 
-    def test_get_by_id_not_found(self, db_session):
-        """Test getting non-existent worker returns None."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
-        repo = WorkerRepository(db_session)
-
-        worker = repo.get_by_id("non-existent-worker")
-
-        assert worker is None
+        assert repo.get_by_id("non-existent-worker") is None
 
     def test_update_worker(self, db_session):
         """Test updating worker fields."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
         repo = WorkerRepository(db_session)
 
         # Create worker
@@ -86,20 +74,17 @@ class TestWorkerRepository:
 
     def test_get_all_active(self, db_session):
         """Test getting all active workers."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
         repo = WorkerRepository(db_session)
 
-        # Create active workers
-        repo.create(worker_id="active-1", hostname="host1", pid=1, version="0.1.0")
-        repo.update("active-1", status=WorkerStatus.ACTIVE)
-
-        repo.create(worker_id="active-2", hostname="host2", pid=2, version="0.1.0")
-        repo.update("active-2", status=WorkerStatus.ACTIVE)
-
-        # Create stopped worker
-        repo.create(worker_id="stopped-1", hostname="host3", pid=3, version="0.1.0")
-        repo.update("stopped-1", status=WorkerStatus.STOPPED)
+        # Create two active workers and one stopped worker
+        create_workers(
+            db_session,
+            [
+                {"worker_id": "active-1", "status": WorkerStatus.ACTIVE},
+                {"worker_id": "active-2", "status": WorkerStatus.ACTIVE},
+                {"worker_id": "stopped-1", "status": WorkerStatus.STOPPED},
+            ],
+        )
 
         # Get all active
         active_workers = repo.get_all_active()
@@ -112,29 +97,25 @@ class TestWorkerRepository:
 
     def test_get_all_stale(self, db_session):
         """Test getting all stale workers."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
         repo = WorkerRepository(db_session)
 
-        # Create worker with old heartbeat (stale)
-        stale_worker = repo.create(
-            worker_id="stale-1",
-            hostname="host1",
-            pid=1,
-            version="0.1.0",
-        )
-        old_heartbeat = datetime.now(timezone.utc) - timedelta(minutes=5)
-        repo.update("stale-1", last_heartbeat_at=old_heartbeat, status=WorkerStatus.ACTIVE)
-
-        # Create worker with recent heartbeat (not stale)
-        recent_worker = repo.create(
-            worker_id="recent-1",
-            hostname="host2",
-            pid=2,
-            version="0.1.0",
+        # Create workers with an old (stale) and a recent heartbeat
+        now = datetime.now(timezone.utc)
+        create_workers(
+            db_session,
+            [
+                {
+                    "worker_id": "stale-1",
+                    "status": WorkerStatus.ACTIVE,
+                    "last_heartbeat_at": now - timedelta(minutes=5),
+                },
+                {
+                    "worker_id": "recent-1",
+                    "status": WorkerStatus.ACTIVE,
+                    "last_heartbeat_at": now - timedelta(seconds=10),
+                },
+            ],
         )
-        recent_heartbeat = datetime.now(timezone.utc) - timedelta(seconds=10)
-        repo.update("recent-1", last_heartbeat_at=recent_heartbeat, status=WorkerStatus.ACTIVE)
 
         # Get stale workers (with 90 second timeout)
         stale_workers = repo.get_all_stale(heartbeat_timeout_seconds=90)
@@ -143,10 +124,8 @@ class TestWorkerRepository:
         assert "stale-1" in worker_ids
         assert "recent-1" not in worker_ids
 
-    def test_increment_current_jobs(self, db_session):
-        """Test incrementing worker's current job count."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
+    def test_increment_and_decrement_current_jobs(self, db_session):
+        """Test the current job count moves up and down and never below zero."""
         repo = WorkerRepository(db_session)
 
         worker = repo.create(
@@ -158,96 +137,42 @@ class TestWorkerRepository:
 
         assert worker.current_job_count == 0
 
-        # Increment
-        updated = repo.increment_current_jobs("test-worker-4")
-
-        assert updated.current_job_count == 1
-
-        # Increment again
-        updated = repo.increment_current_jobs("test-worker-4")
-
-        assert updated.current_job_count == 2
-
-    def test_decrement_current_jobs(self, db_session):
-        """Test decrementing worker's current job count."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
-        repo = WorkerRepository(db_session)
-
-        worker = repo.create(
-            worker_id="test-worker-5",
-            hostname="test-host",
-            pid=12345,
-            version="0.1.0",
-        )
+        # Decrementing when already zero stays at zero
+        counts = [repo.decrement_current_jobs("test-worker-4").current_job_count]
 
-        # Set initial count
-        repo.update("test-worker-5", current_job_count=3)
+        # Increment twice, then decrement twice
+        for change in (
+            repo.increment_current_jobs,
+            repo.increment_current_jobs,
+            repo.decrement_current_jobs,
+            repo.decrement_current_jobs,
+        ):
+            counts.append(change("test-worker-4").current_job_count)
 
-        # Decrement
-        updated = repo.decrement_current_jobs("test-worker-5")
-
-        assert updated.current_job_count == 2
-
-        # Decrement again
-        updated = repo.decrement_current_jobs("test-worker-5")
-
-        assert updated.current_job_count == 1
-
-    def test_decrement_current_jobs_minimum_zero(self, db_session):
-        """Test decrementing job count doesn't go below zero."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
-        repo = WorkerRepository(db_session)
-
-        worker = repo.create(
-            worker_id="test-worker-6",
-            hostname="test-host",
-            pid=12345,
-            version="0.1.0",
-        )
-
-        assert worker.current_job_count == 0
-
-        # Try to decrement when already zero
-        updated = repo.decrement_current_jobs("test-worker-6")
-
-        assert updated.current_job_count == 0
+        assert counts == [0, 1, 2, 1, 0]
 
     def test_delete_old_stopped_workers(self, db_session):
         """Test deleting old stopped workers."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
         repo = WorkerRepository(db_session)
 
-        # Create old stopped worker
-        old_worker = repo.create(
-            worker_id="old-stopped",
-            hostname="host1",
-            pid=1,
-            version="0.1.0",
+        # Create old and recent stopped workers plus an active worker
+        now = datetime.now(timezone.utc)
+        create_workers(
+            db_session,
+            [
+                {
+                    "worker_id": "old-stopped",
+                    "status": WorkerStatus.STOPPED,
+                    "stopped_at": now - timedelta(hours=2),
+                },
+                {
+                    "worker_id": "recent-stopped",
+                    "status": WorkerStatus.STOPPED,
+                    "stopped_at": now - timedelta(minutes=10),
+                },
+                {"worker_id": "active-worker", "status": WorkerStatus.ACTIVE},
+            ],
         )
-        old_time = datetime.now(timezone.utc) - timedelta(hours=2)
-        repo.update("old-stopped", status=WorkerStatus.STOPPED, stopped_at=old_time)
-
-        # Create recent stopped worker
-        recent_worker = repo.create(
-            worker_id="recent-stopped",
-            hostname="host2",
-            pid=2,
-            version="0.1.0",
-        )
-        recent_time = datetime.now(timezone.utc) - timedelta(minutes=10)
-        repo.update("recent-stopped", status=WorkerStatus.STOPPED, stopped_at=recent_time)
-
-        # Create active worker
-        active_worker = repo.create(
-            worker_id="active-worker",
-            hostname="host3",
-            pid=3,
-            version="0.1.0",
-        )
-        repo.update("active-worker", status=WorkerStatus.ACTIVE)
 
         # Delete old stopped workers (older than 1 hour)
         deleted_count = repo.delete_old_stopped_workers(cleanup_after_seconds=3600)
@@ -265,19 +190,17 @@ class TestWorkerRepository:
 
     def test_get_all(self, db_session):
         """Test getting all workers regardless of status."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
         repo = WorkerRepository(db_session)
 
         # Create workers with different statuses
-        repo.create(worker_id="w1", hostname="host1", pid=1, version="0.1.0")
-        repo.update("w1", status=WorkerStatus.ACTIVE)
-
-        repo.create(worker_id="w2", hostname="host2", pid=2, version="0.1.0")
-        repo.update("w2", status=WorkerStatus.STOPPED)
-
-        repo.create(worker_id="w3", hostname="host3", pid=3, version="0.1.0")
-        repo.update("w3", status=WorkerStatus.STALE)
+        create_workers(
+            db_session,
+            [
+                {"worker_id": "w1", "status": WorkerStatus.ACTIVE},
+                {"worker_id": "w2", "status": WorkerStatus.STOPPED},
+                {"worker_id": "w3", "status": WorkerStatus.STALE},
+            ],
+        )
 
         # Get all workers
         all_workers = repo.get_all()
@@ -290,8 +213,6 @@ class TestWorkerRepository:
 
     def test_increment_job_metrics(self, db_session):
         """Test incrementing job processing metrics."""
-        from schedora.repositories.worker_repository import WorkerRepository
-
         repo = WorkerRepository(db_session)
 
         worker = repo.create(
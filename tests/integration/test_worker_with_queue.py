@@ -2,12 +2,15 @@
 import pytest
 import asyncio
 from uuid import uuid4
+from sqlalchemy import select
 from schedora.worker.async_worker import AsyncWorker
-from schedora.worker.handler_registry import HandlerRegistry
 from schedora.services.redis_queue import RedisQueue
 from schedora.services.job_service import JobService
 from schedora.api.schemas.job import JobCreate
 from schedora.core.enums import JobStatus
+from schedora.models.job import Job
+from tests.factories.job_factory import unique_key
+from tests.integration.helpers import wait_for_all_status, wait_for_status
 
 
 @pytest.mark.asyncio
@@ -15,22 +18,16 @@ from schedora.core.enums import JobStatus
 class TestAsyncWorkerWithQueue:
     """Test AsyncWorker integrates with Redis queue."""
 
-    async def test_worker_dequeues_from_redis(self, db_session, redis_client):
+    async def test_worker_dequeues_from_redis(self, db_session, redis_client, handler_registry):
         """Test worker dequeues jobs from Redis queue."""
-        from schedora.worker.handlers.echo_handler import echo_handler
-
         queue = RedisQueue(redis_client, queue_name="test_worker_dequeue")
-        queue.purge()
-
-        registry = HandlerRegistry()
-        registry.register_handler("echo", echo_handler)
 
         worker = AsyncWorker(
             worker_id="test-dequeue-worker",
             db_session=db_session,
-            handler_registry=registry,
+            handler_registry=handler_registry,
             max_concurrent_jobs=5,
-            poll_interval=0.1,
+            poll_interval=0.01,
             use_test_session=True,
             queue=queue,
         )
@@ -40,7 +37,7 @@ class TestAsyncWorkerWithQueue:
         job_data = JobCreate(
             type="echo",
             payload={"message": "test"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
         )
         job = job_service.create_job(job_data)
 
@@ -49,7 +46,7 @@ class TestAsyncWorkerWithQueue:
 
         # Start worker
         worker_task = asyncio.create_task(worker.start())
-        await asyncio.sleep(0.5)  # Let worker process job
+        await wait_for_status(db_session, job.job_id, JobStatus.SUCCESS)
 
         # Stop worker
         await worker.stop(timeout=2.0)
@@ -59,26 +56,18 @@ class TestAsyncWorkerWithQueue:
             pass
 
         # Verify job was processed
-        db_session.refresh(job)
-        assert job.status == JobStatus.SUCCESS
         assert queue.get_queue_length() == 0
 
-    async def test_worker_respects_priority(self, db_session, redis_client):
+    async def test_worker_respects_priority(self, db_session, redis_client, handler_registry):
         """Test worker processes high priority jobs first."""
-        from schedora.worker.handlers.echo_handler import echo_handler
-
         queue = RedisQueue(redis_client, queue_name="test_priority_worker")
-        queue.purge()
-
-        registry = HandlerRegistry()
-        registry.register_handler("echo", echo_handler)
 
         worker = AsyncWorker(
             worker_id="test-priority-worker",
             db_session=db_session,
-            handler_registry=registry,
+            handler_registry=handler_registry,
             max_concurrent_jobs=1,  # Process one at a time
-            poll_interval=0.1,
+            poll_interval=0.01,
             use_test_session=True,
             queue=queue,
         )
@@ -89,7 +78,7 @@ class TestAsyncWorkerWithQueue:
             JobCreate(
                 type="echo",
                 payload={"message": "low"},
-                idempotency_key=f"low-{uuid4()}",
+                idempotency_key=unique_key("low"),
                 priority=1,
             )
         )
@@ -99,7 +88,7 @@ class TestAsyncWorkerWithQueue:
             JobCreate(
                 type="echo",
                 payload={"message": "high"},
-                idempotency_key=f"high-{uuid4()}",
+                idempotency_key=unique_key("high"),
                 priority=10,
             )
         )
@@ -109,7 +98,7 @@ class TestAsyncWorkerWithQueue:
 
         # Start worker
         worker_task = asyncio.create_task(worker.start())
-        await asyncio.sleep(0.3)  # Process first job
+        await wait_for_status(db_session, high_priority_job.job_id, JobStatus.SUCCESS)
 
         # Stop worker before second job
         await worker.stop(timeout=2.0)
@@ -122,22 +111,16 @@ class TestAsyncWorkerWithQueue:
         db_session.refresh(high_priority_job)
         assert high_priority_job.status == JobStatus.SUCCESS
 
-    async def test_worker_handles_empty_queue(self, db_session, redis_client):
+    async def test_worker_handles_empty_queue(self, db_session, redis_client, handler_registry):
         """Test worker handles empty queue gracefully."""
-        from schedora.worker.handlers.echo_handler import echo_handler
-
         queue = RedisQueue(redis_client, queue_name="test_empty_queue")
-        queue.purge()
-
-        registry = HandlerRegistry()
-        registry.register_handler("echo", echo_handler)
 
         worker = AsyncWorker(
             worker_id="test-empty-queue-worker",
             db_session=db_session,
-            handler_registry=registry,
+            handler_registry=handler_registry,
             max_concurrent_jobs=5,
-            poll_interval=0.1,
+            poll_interval=0.01,
             use_test_session=True,
             queue=queue,
         )
@@ -158,23 +141,19 @@ class TestAsyncWorkerWithQueue:
 
         assert not worker.is_running
 
-    async def test_multiple_workers_dont_duplicate(self, db_session, redis_client):
+    async def test_multiple_workers_dont_duplicate(
+        self, db_session, redis_client, handler_registry
+    ):
         """Test multiple workers don't process same job."""
-        from schedora.worker.handlers.sleep_handler import sleep_handler
-
         queue = RedisQueue(redis_client, queue_name="test_multi_worker")
-        queue.purge()
-
-        registry = HandlerRegistry()
-        registry.register_handler("sleep", sleep_handler)
 
         # Create two workers
         worker1 = AsyncWorker(
             worker_id="test-multi-worker-1",
             db_session=db_session,
-            handler_registry=registry,
+            handler_registry=handler_registry,
             max_concurrent_jobs=5,
-            poll_interval=0.1,
+            poll_interval=0.01,
             use_test_session=True,
             queue=queue,
         )
@@ -182,9 +161,9 @@ class TestAsyncWorkerWithQueue:
         worker2 = AsyncWorker(
             worker_id="test-multi-worker-2",
             db_session=db_session,
-            handler_registry=registry,
+            handler_registry=handler_registry,
             max_concurrent_jobs=5,
-            poll_interval=0.1,
+            poll_interval=0.01,
             use_test_session=True,
             queue=queue,
         )
@@ -195,14 +174,14 @@ class TestAsyncWorkerWithQueue:
             JobCreate(
                 type="sleep",
                 payload={"duration": 0.5},
-                idempotency_key=f"sleep-{uuid4()}",
+                idempotency_key=unique_key("sleep"),
             )
         )
 
         # Start both workers
         task1 = asyncio.create_task(worker1.start())
         task2 = asyncio.create_task(worker2.start())
-        await asyncio.sleep(1.0)  # Let workers process
+        await wait_for_status(db_session, job.job_id, JobStatus.SUCCESS)
 
         # Stop workers
         await worker1.stop(timeout=2.0)
@@ -219,44 +198,40 @@ class TestAsyncWorkerWithQueue:
         # Only one worker should have processed it
         assert job.worker_id in ["test-multi-worker-1", "test-multi-worker-2"]
 
-    async def test_worker_processes_multiple_jobs(self, db_session, redis_client):
+    async def test_worker_processes_multiple_jobs(self, db_session, redis_client, handler_registry):
         """Test worker processes multiple jobs from queue."""
-        from schedora.worker.handlers.echo_handler import echo_handler
-
         queue = RedisQueue(redis_client, queue_name="test_multi_jobs")
-        queue.purge()
-
-        registry = HandlerRegistry()
-        registry.register_handler("echo", echo_handler)
 
         worker = AsyncWorker(
             worker_id="test-multi-jobs-worker",
             db_session=db_session,
-            handler_registry=registry,
+            handler_registry=handler_registry,
             max_concurrent_jobs=10,
-            poll_interval=0.1,
+            poll_interval=0.01,
             use_test_session=True,
             queue=queue,
         )
 
         # Create 5 jobs
         job_service = JobService(db_session, queue=queue)
-        jobs = []
-        for i in range(5):
-            job = job_service.create_job(
+        jobs = job_service.create_jobs_bulk(
+            [
                 JobCreate(
                     type="echo",
                     payload={"index": i},
-                    idempotency_key=f"test-{uuid4()}",
+                    idempotency_key=unique_key("test"),
                 )
-            )
-            jobs.append(job)
+                for i in range(5)
+            ]
+        )
 
         assert queue.get_queue_length() == 5
 
         # Start worker
         worker_task = asyncio.create_task(worker.start())
-        await asyncio.sleep(1.0)  # Let worker process all jobs
+        await wait_for_all_status(
+            db_session, (job.job_id for job in jobs), JobStatus.SUCCESS
+        )
 
         # Stop worker
         await worker.stop(timeout=2.0)
@@ -266,26 +241,21 @@ class TestAsyncWorkerWithQueue:
             pass
 
         # All jobs should be processed
-        for job in jobs:
-            db_session.refresh(job)
-            assert job.status == JobStatus.SUCCESS
+        statuses = db_session.scalars(
+            select(Job.status).where(Job.job_id.in_([job.job_id for job in jobs]))
+        ).all()
+        assert statuses == [JobStatus.SUCCESS] * len(jobs)
 
         assert queue.get_queue_length() == 0
 
-    async def test_worker_without_queue_still_works(self, db_session):
+    async def test_worker_without_queue_still_works(self, db_session, handler_registry):
         """Test worker works without queue (backward compatibility)."""
-        from schedora.worker.handlers.echo_handler import echo_handler
-        from schedora.models.job import Job
-
-        registry = HandlerRegistry()
-        registry.register_handler("echo", echo_handler)
-
         worker = AsyncWorker(
             worker_id="test-no-queue-worker",
             db_session=db_session,
-            handler_registry=registry,
+            handler_registry=handler_registry,
             max_concurrent_jobs=5,
-            poll_interval=0.1,
+            poll_interval=0.01,
             use_test_session=True,
             # No queue parameter - uses DB polling
         )
@@ -295,7 +265,7 @@ class TestAsyncWorkerWithQueue:
             job_id=uuid4(),
             type="echo",
             payload={"message": "test"},
-            idempotency_key=f"test-{uuid4()}",
+            idempotency_key=unique_key("test"),
             status=JobStatus.PENDING,
         )
         db_session.add(job)
@@ -303,7 +273,7 @@ class TestAsyncWorkerWithQueue:
 
         # Start worker
         worker_task = asyncio.create_task(worker.start())
-        await asyncio.sleep(0.5)  # Let worker process
+        await wait_for_status(db_session, job.job_id, JobStatus.SUCCESS)
 
         # Stop worker
         await worker.stop(timeout=2.0)
@@ -311,7 +281,3 @@ class TestAsyncWorkerWithQueue:
             await asyncio.wait_for(worker_task, timeout=1.0)
         except asyncio.TimeoutError:
             pass
-
-        # Job should be processed
-        db_session.refresh(job)
-        assert job.status == JobStatus.SUCCESS
@@ -6,6 +6,7 @@ from schedora.core.enums import JobStatus
 from tests.factories.job_factory import create_job
 
 
+@pytest.mark.sqlite
 class TestWorkflowModel:
     """Test Workflow SQLAlchemy model."""
 
@@ -16,8 +17,7 @@ class TestWorkflowModel:
             description="Test workflow",
         )
         db_session.add(workflow)
-        db_session.commit()
-        db_session.refresh(workflow)
+        db_session.flush()
 
         assert workflow.workflow_id is not None
         assert workflow.name == "test_workflow"
@@ -31,7 +31,7 @@ class TestWorkflowModel:
             description="Order processing workflow",
         )
         db_session.add(workflow)
-        db_session.commit()
+        db_session.flush()
 
         # Create jobs associated with workflow
         job1 = create_job(
@@ -48,8 +48,7 @@ class TestWorkflowModel:
         # Associate jobs with workflow
         workflow.jobs.append(job1)
         workflow.jobs.append(job2)
-        db_session.commit()
-        db_session.refresh(workflow)
+        db_session.flush()
 
         assert len(workflow.jobs) == 2
         assert job1 in workflow.jobs
@@ -68,6 +67,7 @@ class TestWorkflowModel:
         with pytest.raises(IntegrityError):
             db_session.commit()
 
+    @pytest.mark.requires_postgres
     def test_workflow_config_jsonb(self, db_session):
         """Test workflow can store config as JSONB."""
         config = {
@@ -82,7 +82,8 @@ class TestWorkflowModel:
             config=config,
         )
         db_session.add(workflow)
-        db_session.commit()
+        db_session.flush()
+        # Reload so the assertion checks what came back from the column
         db_session.refresh(workflow)
 
         assert workflow.config == config
@@ -6,6 +6,7 @@ from tests.factories.job_factory import create_job
 from schedora.core.enums import JobStatus
 
 
+@pytest.mark.sqlite
 class TestWorkflowRepository:
     """Test workflow repository CRUD operations."""
 
@@ -41,8 +42,9 @@ class TestWorkflowRepository:
         assert workflow.config == config
         assert workflow.config["timeout"] == 3600
 
-    def test_get_by_id_found(self, db_session):
-        """Test getting workflow by ID when it exists."""
+    def test_get_by_id(self, db_session):
+        """Test getting workflow by ID, and None for an unknown ID."""
+        import uuid
         repo = WorkflowRepository(db_session)
 
         workflow = repo.create(name="get_test")
@@ -52,17 +54,10 @@ class TestWorkflowRepository:
         assert retrieved.workflow_id == workflow.workflow_id
         assert retrieved.name == "get_test"
 
-    def test_get_by_id_not_found(self, db_session):
-        """Test getting workflow by ID when it doesn't exist."""
-        import uuid
-        repo = WorkflowRepository(db_session)
-
-        retrieved = repo.get_by_id(uuid.uuid4())
+        assert repo.get_by_id(uuid.uuid4()) is None
 
-        assert retrieved is None
-
-    def test_get_by_name_found(self, db_session):
-        """Test getting workflow by name when it exists."""
+    def test_get_by_name(self, db_session):
+        """Test getting workflow by name, and None for an unknown name."""
         repo = WorkflowRepository(db_session)
 
         workflow = repo.create(name="unique_name")
@@ -71,13 +66,7 @@ class TestWorkflowRepository:
         assert retrieved is not None
         assert retrieved.workflow_id == workflow.workflow_id
 
-    def test_get_by_name_not_found(self, db_session):
-        """Test getting workflow by name when it doesn't exist."""
-        repo = WorkflowRepository(db_session)
-
-        retrieved = repo.get_by_name("nonexistent")
-
-        assert retrieved is None
+        assert repo.get_by_name("nonexistent") is None
 
     def test_add_job_to_workflow(self, db_session):
         """Test adding a job to a workflow."""
@@ -100,12 +89,24 @@ class TestWorkflowRepository:
         job1 = create_job(db_session, job_type="job1", idempotency_key="multi-1")
         job2 = create_job(db_session, job_type="job2", idempotency_key="multi-2")
 
-        repo.add_job(workflow.workflow_id, job1.job_id)
-        repo.add_job(workflow.workflow_id, job2.job_id)
+        repo.add_jobs(workflow.workflow_id, [job1.job_id, job2.job_id])
 
         db_session.refresh(workflow)
         assert len(workflow.jobs) == 2
 
+    def test_add_jobs_skips_unknown_ids(self, db_session):
+        """Test bulk-adding jobs ignores IDs that do not exist."""
+        import uuid
+        repo = WorkflowRepository(db_session)
+
+        workflow = repo.create(name="bulk_job_workflow")
+        job = create_job(db_session, job_type="job1", idempotency_key="bulk-1")
+
+        repo.add_jobs(workflow.workflow_id, [job.job_id, uuid.uuid4()])
+
+        db_session.refresh(workflow)
+        assert [j.job_id for j in workflow.jobs] == [job.job_id]
+
     def test_get_workflow_jobs(self, db_session):
         """Test retrieving jobs associated with a workflow."""
         repo = WorkflowRepository(db_session)
@@ -114,8 +115,7 @@ class TestWorkflowRepository:
         job1 = create_job(db_session, job_type="job1", idempotency_key="get-1")
         job2 = create_job(db_session, job_type="job2", idempotency_key="get-2")
 
-        repo.add_job(workflow.workflow_id, job1.job_id)
-        repo.add_job(workflow.workflow_id, job2.job_id)
+        repo.add_jobs(workflow.workflow_id, [job1.job_id, job2.job_id])
 
         jobs = repo.get_workflow_jobs(workflow.workflow_id)
 
@@ -138,8 +138,7 @@ class TestMetricsCoverage:
         Test update_queue_metrics updates gauges correctly.
         """
         mock_queue = Mock()
-        mock_queue.get_queue_length.return_value = 10
-        mock_queue.get_dlq_length.return_value = 2
+        mock_queue.get_lengths.return_value = (10, 2)
 
         with patch("schedora.observability.metrics.queue_length") as mock_queue_gauge:
             with patch("schedora.observability.metrics.queue_dlq_length") as mock_dlq_gauge:
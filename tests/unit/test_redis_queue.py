@@ -1,9 +1,30 @@
 """Unit tests for Redis queue service."""
+import json
 import pytest
 from uuid import uuid4
 from unittest.mock import Mock, MagicMock
 
 
+def _mock_redis_with_scripts():
+    """
+    Build a mock Redis client whose Lua scripts are separate mocks.
+
+    Returns:
+        Tuple of the mock client and its script mocks, keyed by script name
+    """
+    from schedora.services import redis_queue
+
+    scripts = {"enqueue": Mock(), "move_to_dlq": Mock(), "rescore_legacy": Mock()}
+    by_source = {
+        redis_queue._ENQUEUE_SCRIPT: scripts["enqueue"],
+        redis_queue._MOVE_TO_DLQ_SCRIPT: scripts["move_to_dlq"],
+        redis_queue._RESCORE_LEGACY_SCRIPT: scripts["rescore_legacy"],
+    }
+    mock_redis = Mock()
+    mock_redis.register_script.side_effect = by_source.__getitem__
+    return mock_redis, scripts
+
+
 class TestRedisQueue:
     """Test RedisQueue service."""
 
@@ -11,31 +32,70 @@ class TestRedisQueue:
         """Test enqueuing a job to Redis."""
         from schedora.services.redis_queue import RedisQueue
 
-        mock_redis = Mock()
+        mock_redis, scripts = _mock_redis_with_scripts()
         queue = RedisQueue(mock_redis)
 
         job_id = uuid4()
         queue.enqueue(job_id, priority=5)
 
-        # Verify zadd was called with correct arguments
-        mock_redis.zadd.assert_called_once()
-        call_args = mock_redis.zadd.call_args
-        assert call_args[0][0] == "schedora:queue:jobs"  # queue name
-        assert str(job_id) in call_args[0][1]  # job_id in mapping
-        assert call_args[0][1][str(job_id)] == 5  # priority
+        # Verify the enqueue script was called with correct arguments
+        scripts["enqueue"].assert_called_once_with(
+            keys=["schedora:queue:jobs", "schedora:queue:jobs:seq"],
+            args=[RedisQueue.PRIORITY_SCALE, 5, str(job_id)],
+        )
 
     def test_enqueue_with_default_priority(self):
         """Test enqueuing with default priority (0)."""
         from schedora.services.redis_queue import RedisQueue
 
-        mock_redis = Mock()
+        mock_redis, scripts = _mock_redis_with_scripts()
         queue = RedisQueue(mock_redis)
 
         job_id = uuid4()
         queue.enqueue(job_id)  # No priority specified
 
-        call_args = mock_redis.zadd.call_args
-        assert call_args[0][1][str(job_id)] == 0
+        call_args = scripts["enqueue"].call_args
+        assert call_args.kwargs["args"][1:] == [0, str(job_id)]
+
+    def test_enqueue_many_uses_single_script_call(self):
+        """Test enqueuing several jobs issues one script call with all of them."""
+        from schedora.services.redis_queue import RedisQueue
+
+        mock_redis, scripts = _mock_redis_with_scripts()
+        queue = RedisQueue(mock_redis)
+
+        job1, job2 = uuid4(), uuid4()
+        queue.enqueue_many([(job1, 3), (job2, 7)])
+
+        scripts["enqueue"].assert_called_once_with(
+            keys=["schedora:queue:jobs", "schedora:queue:jobs:seq"],
+            args=[RedisQueue.PRIORITY_SCALE, 3, str(job1), 7, str(job2)],
+        )
+
+    def test_enqueue_many_empty_is_noop(self):
+        """Test enqueuing an empty batch does not call Redis."""
+        from schedora.services.redis_queue import RedisQueue
+
+        mock_redis, scripts = _mock_redis_with_scripts()
+        queue = RedisQueue(mock_redis)
+
+        queue.enqueue_many([])
+
+        scripts["enqueue"].assert_not_called()
+
+    def test_rescore_legacy_entries(self):
+        """Test rescoring legacy entries is one script call on the queue and counter."""
+        from schedora.services.redis_queue import RedisQueue
+
+        mock_redis, scripts = _mock_redis_with_scripts()
+        scripts["rescore_legacy"].return_value = 3
+        queue = RedisQueue(mock_redis)
+
+        assert queue.rescore_legacy_entries() == 3
+        scripts["rescore_legacy"].assert_called_once_with(
+            keys=["schedora:queue:jobs", "schedora:queue:jobs:seq"],
+            args=[RedisQueue.PRIORITY_SCALE],
+        )
 
     def test_dequeue_job(self):
         """Test dequeuing highest priority job."""
@@ -63,6 +123,30 @@ class TestRedisQueue:
 
         assert result is None
 
+    def test_dequeue_many(self):
+        """Test dequeuing several jobs with a single ZPOPMAX."""
+        from schedora.services.redis_queue import RedisQueue
+
+        mock_redis = Mock()
+        job_ids = [uuid4(), uuid4()]
+        mock_redis.zpopmax.return_value = [(str(job_id), 5) for job_id in job_ids]
+
+        queue = RedisQueue(mock_redis)
+        result = queue.dequeue_many(3)
+
+        assert result == job_ids
+        mock_redis.zpopmax.assert_called_once_with("schedora:queue:jobs", count=3)
+
+    def test_dequeue_many_non_positive(self):
+        """Test dequeuing zero jobs skips Redis."""
+        from schedora.services.redis_queue import RedisQueue
+
+        mock_redis = Mock()
+        queue = RedisQueue(mock_redis)
+
+        assert queue.dequeue_many(0) == []
+        mock_redis.zpopmax.assert_not_called()
+
     def test_get_queue_length(self):
         """Test getting queue length."""
         from schedora.services.redis_queue import RedisQueue
@@ -80,18 +164,49 @@ class TestRedisQueue:
         """Test moving job to dead letter queue."""
         from schedora.services.redis_queue import RedisQueue
 
-        mock_redis = Mock()
-        mock_redis.zrem.return_value = 1  # Job found and removed
+        mock_redis, scripts = _mock_redis_with_scripts()
         queue = RedisQueue(mock_redis)
 
         job_id = uuid4()
         queue.move_to_dlq(job_id, "Max retries exceeded")
 
-        # Verify job added to DLQ with metadata
-        mock_redis.hset.assert_called_once()
-        call_args = mock_redis.hset.call_args
-        assert "schedora:queue:jobs:dlq" in call_args[0]
-        assert str(job_id) in call_args[0]
+        # Verify job added to DLQ with metadata and removed from queue
+        script = scripts["move_to_dlq"]
+        script.assert_called_once()
+        call_kwargs = script.call_args.kwargs
+        assert call_kwargs["keys"] == ["schedora:queue:jobs", "schedora:queue:jobs:dlq"]
+        stored_id, dlq_data = call_kwargs["args"]
+        assert stored_id == str(job_id)
+        assert json.loads(dlq_data)["reason"] == "Max retries exceeded"
+
+    def test_move_many_to_dlq(self):
+        """Test moving several jobs to the DLQ in one script call."""
+        from schedora.services.redis_queue import RedisQueue
+
+        mock_redis, scripts = _mock_redis_with_scripts()
+        queue = RedisQueue(mock_redis)
+
+        jobs = [(uuid4(), f"Error {i}") for i in range(3)]
+        queue.move_many_to_dlq(jobs)
+
+        script = scripts["move_to_dlq"]
+        script.assert_called_once()
+        args = script.call_args.kwargs["args"]
+        assert args[::2] == [str(job_id) for job_id, _ in jobs]
+        assert [json.loads(data)["reason"] for data in args[1::2]] == [
+            reason for _, reason in jobs
+        ]
+
+    def test_move_many_to_dlq_empty(self):
+        """Test moving no jobs skips the script call."""
+        from schedora.services.redis_queue import RedisQueue
+
+        mock_redis, scripts = _mock_redis_with_scripts()
+        queue = RedisQueue(mock_redis)
+
+        queue.move_many_to_dlq([])
+
+        scripts["move_to_dlq"].assert_not_called()
 
     def test_get_dlq_length(self):
         """Test getting dead letter queue length."""
@@ -106,18 +221,33 @@ class TestRedisQueue:
         assert length == 5
         mock_redis.hlen.assert_called_once_with("schedora:queue:jobs:dlq")
 
+    def test_get_lengths(self):
+        """Test queue and DLQ lengths are read in one pipeline."""
+        from schedora.services.redis_queue import RedisQueue
+
+        mock_redis = Mock()
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [7, 3]
+
+        queue = RedisQueue(mock_redis)
+
+        assert queue.get_lengths() == (7, 3)
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.zcard.assert_called_once_with("schedora:queue:jobs")
+        pipe.hlen.assert_called_once_with("schedora:queue:jobs:dlq")
+
     def test_custom_queue_name(self):
         """Test using custom queue name."""
         from schedora.services.redis_queue import RedisQueue
 
-        mock_redis = Mock()
+        mock_redis, scripts = _mock_redis_with_scripts()
         queue = RedisQueue(mock_redis, queue_name="custom_queue")
 
         job_id = uuid4()
         queue.enqueue(job_id)
 
-        call_args = mock_redis.zadd.call_args
-        assert call_args[0][0] == "schedora:queue:custom_queue"
+        call_args = scripts["enqueue"].call_args
+        assert call_args.kwargs["keys"][0] == "schedora:queue:custom_queue"
 
     def test_peek_next_job(self):
         """Test peeking at next job without removing it."""
@@ -135,6 +265,20 @@ class TestRedisQueue:
         mock_redis.zrange.assert_called_once()
         mock_redis.zpopmax.assert_not_called()
 
+    def test_peek_many(self):
+        """Test peeking at several jobs in dequeue order."""
+        from schedora.services.redis_queue import RedisQueue
+
+        mock_redis = Mock()
+        job1, job2 = uuid4(), uuid4()
+        mock_redis.zrange.return_value = [str(job1), str(job2)]
+
+        queue = RedisQueue(mock_redis)
+        result = queue.peek_many(2)
+
+        assert result == [job1, job2]
+        mock_redis.zrange.assert_called_once_with("schedora:queue:jobs", 0, 1, desc=True)
+
     def test_remove_specific_job(self):
         """Test removing a specific job from queue."""
         from schedora.services.redis_queue import RedisQueue
@@ -149,6 +293,20 @@ class TestRedisQueue:
         assert removed is True
         mock_redis.zrem.assert_called_once_with("schedora:queue:jobs", str(job_id))
 
+    def test_remove_many_uses_single_zrem(self):
+        """Test removing several jobs issues one ZREM with all of them."""
+        from schedora.services.redis_queue import RedisQueue
+
+        mock_redis = Mock()
+        mock_redis.zrem.return_value = 2
+        queue = RedisQueue(mock_redis)
+
+        job1, job2 = uuid4(), uuid4()
+        removed = queue.remove_many([job1, job2])
+
+        assert removed == 2
+        mock_redis.zrem.assert_called_once_with("schedora:queue:jobs", str(job1), str(job2))
+
     def test_purge_queue(self):
         """Test purging all jobs from queue."""
         from schedora.services.redis_queue import RedisQueue
@@ -158,4 +316,4 @@ class TestRedisQueue:
 
         queue.purge()
 
-        mock_redis.delete.assert_called_once_with("schedora:queue:jobs")
+        mock_redis.unlink.assert_called_once_with("schedora:queue:jobs")